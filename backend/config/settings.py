@@ -39,6 +39,9 @@ class Config:
     GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
     GEMINI_MODEL = "gemini-1.5-pro"  # Gemini 1.5 Pro (audio analysis)
     ENABLE_AUDIO_QC = False  # Disabled - library deprecated
+    # Run audio QC once for the whole batch after generation instead of per attempt.
+    # Trades QC-driven retries (suggested audio tags) for fewer, overlapped Gemini calls.
+    DEFERRED_AUDIO_QC = os.getenv("DEFERRED_AUDIO_QC", "False").lower() == "true"
 
     # ==================== Audio Settings ====================
     AUDIO_FORMAT = "mp3"
@@ -85,6 +88,11 @@ class Config:
     # Retryable HTTP status codes
     RETRYABLE_STATUS_CODES = [429, 500, 503, 504]
 
+    # Proactive rate limiting (token buckets shared by all worker threads)
+    # Budgets are per minute; a full minute's budget may be spent in a burst.
+    ELEVENLABS_CHARS_PER_MINUTE = int(os.getenv("ELEVENLABS_CHARS_PER_MINUTE", 60000))
+    GEMINI_TOKENS_PER_MINUTE = int(os.getenv("GEMINI_TOKENS_PER_MINUTE", 250000))
+
     # ==================== Output Settings ====================
     OUTPUT_DIR = OUTPUT_DIR
     OUTPUT_COMPLETED_DIR = OUTPUT_DIR / "completed"
@@ -92,6 +100,13 @@ class Config:
     OUTPUT_NEEDS_REVIEW_DIR = OUTPUT_DIR / "needs_review"
     LOGS_DIR = LOGS_DIR
 
+    # On-disk cache of Gemini audio QC results, keyed by script + audio hash,
+    # so a rerun doesn't pay again for audio that was already scored
+    CACHE_DIR = BASE_DIR / "cache"
+    ENABLE_RESULT_CACHE = os.getenv("ENABLE_RESULT_CACHE", "True").lower() == "true"
+    RESULT_CACHE_MAX_ENTRIES = 10000
+    RESULT_CACHE_TTL_SECONDS = 30 * 24 * 3600  # Re-score audio after a month
+
     # ==================== Logging Settings ====================
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
@@ -109,8 +124,13 @@ class Config:
     UPLOAD_FOLDER = BASE_DIR / "uploads"
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16 MB max file size
 
+    # In-memory batch tracking for the web app (status, results, download zips)
+    MAX_TRACKED_BATCHES = 256
+    BATCH_TTL_SECONDS = 24 * 3600  # Uploads and zips older than this are swept too
+
     # ==================== Batch Processing Settings ====================
-    MAX_CONCURRENT_REQUESTS = 5  # Maximum concurrent API requests
+    MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", 5))  # Items processed in parallel
+    BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", 4))  # Batches run at once by the web app
     BATCH_CHECKPOINT_INTERVAL = 5  # Save checkpoint every N items
 
     # ==================== CSV Column Names ====================
@@ -164,6 +184,12 @@ class Config:
         if cls.MAX_RETRIES < 1:
             errors.append("MAX_RETRIES must be at least 1")
 
+        if cls.BATCH_WORKERS < 1:
+            errors.append("BATCH_WORKERS must be at least 1")
+
+        if cls.ELEVENLABS_CHARS_PER_MINUTE <= 0 or cls.GEMINI_TOKENS_PER_MINUTE <= 0:
+            errors.append("Rate limit budgets must be positive")
+
         return len(errors) == 0, errors
 
     @classmethod
@@ -61,8 +61,13 @@ def cli(ctx, verbose):
     is_flag=True,
     help='Validate input without generating'
 )
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Do not read or write the on-disk QC result cache'
+)
 @click.pass_context
-def generate(ctx, input_file, output_dir, max_retries, dry_run):
+def generate(ctx, input_file, output_dir, max_retries, dry_run, no_cache):
     """
     Generate voiceovers from CSV/Excel file.
 
@@ -75,6 +80,9 @@ def generate(ctx, input_file, output_dir, max_retries, dry_run):
     if output_dir:
         config.OUTPUT_DIR = Path(output_dir)
 
+    if no_cache:
+        config.ENABLE_RESULT_CACHE = False
+
     try:
         # Initialize orchestrator
         orchestrator = VoiceoverOrchestrator(config)
@@ -102,12 +110,12 @@ def generate(ctx, input_file, output_dir, max_retries, dry_run):
             # Create progress bar
             progress_bar = None
 
-            def progress_callback(current, total, item):
+            def progress_callback(event):
                 nonlocal progress_bar
                 if progress_bar is None:
-                    progress_bar = tqdm(total=total, desc="Generating", unit="item")
+                    progress_bar = tqdm(total=event.total, desc="Generating", unit="item")
                 progress_bar.update(1)
-                progress_bar.set_postfix_str(f"{item.filename} ({item.status})")
+                progress_bar.set_postfix_str(f"{event.item.filename} ({event.item.status})")
 
             # Process batch
             batch_result = orchestrator.process_batch(
@@ -2,9 +2,11 @@
 Audio processor module for handling audio file operations,
 duration measurement, and audio format conversions.
 """
+from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
-from typing import Union, Optional
+from typing import Union, Optional, Tuple
+import hashlib
 import logging
 
 from pydub import AudioSegment
@@ -14,6 +16,40 @@ from pydub.silence import detect_leading_silence
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class AudioBlob:
+    """
+    Audio bytes with derived values computed once and cached.
+
+    Lets one generated clip be passed through the pipeline without each
+    stage re-decoding it for its duration or re-hashing it.
+    """
+
+    data: bytes
+    _duration: Optional[float] = field(default=None, repr=False)
+    _digest: Optional[bytes] = field(default=None, repr=False)
+
+    def duration(self, processor: "AudioProcessor") -> float:
+        """
+        Get duration in seconds, measuring it on first call.
+
+        Args:
+            processor: AudioProcessor used to measure the audio
+
+        Returns:
+            Duration in seconds
+        """
+        if self._duration is None:
+            self._duration = processor.get_duration(self.data)
+        return self._duration
+
+    def digest(self) -> bytes:
+        """Get a 16-byte blake2b digest of the audio bytes."""
+        if self._digest is None:
+            self._digest = hashlib.blake2b(self.data, digest_size=16).digest()
+        return self._digest
+
+
 class AudioProcessor:
     """
     Handles audio file operations including:
@@ -92,6 +128,37 @@ class AudioProcessor:
         Returns:
             Trimmed audio as bytes with padding
 
+        Raises:
+            ValueError: If audio data is invalid
+        """
+        output_bytes, _ = self.trim_silence_with_duration(
+            audio_data,
+            silence_threshold=silence_threshold,
+            chunk_size=chunk_size,
+            padding_ms=padding_ms
+        )
+        return output_bytes
+
+    def trim_silence_with_duration(
+        self,
+        audio_data: bytes,
+        silence_threshold: int = -50,
+        chunk_size: int = 10,
+        padding_ms: int = 75
+    ) -> Tuple[bytes, float]:
+        """
+        Trim silence like trim_silence and also return the trimmed duration,
+        taken from the decoded audio so callers don't decode it again.
+
+        Args:
+            audio_data: Input audio as bytes
+            silence_threshold: Silence threshold in dBFS (default: -50 dB)
+            chunk_size: Minimum silence length to detect in ms (default: 10ms)
+            padding_ms: Padding to leave at start/end in ms (default: 75ms)
+
+        Returns:
+            Tuple of (trimmed audio bytes, trimmed duration in seconds)
+
         Raises:
             ValueError: If audio data is invalid
         """
@@ -131,7 +198,7 @@ class AudioProcessor:
                 f"padding: {padding_ms}ms)"
             )
 
-            return output_bytes
+            return output_bytes, trimmed_duration
 
         except Exception as e:
             logger.error(f"Failed to trim silence: {e}")
@@ -0,0 +1,103 @@
+"""
+Bounded, expiring mapping for in-process state.
+"""
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+import threading
+import time
+
+
+class TTLCache(MutableMapping):
+    """
+    Thread-safe dict that holds at most ``maxsize`` entries for ``ttl`` seconds.
+
+    Entries expire ``ttl`` seconds after they were last set. When full, the
+    least recently used entry is evicted. Values are returned as stored, so
+    mutating a stored dict in place (``cache[key].update(...)``) works as it
+    would with a plain dict but does not extend its lifetime.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Seconds an entry lives after it was last set
+            on_evict: Optional callback called with (key, value) for entries
+                dropped by expiry or the size bound (not for ``del``)
+
+        Raises:
+            ValueError: If maxsize or ttl is not positive
+        """
+        if maxsize <= 0 or ttl <= 0:
+            raise ValueError("maxsize and ttl must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _expire(self, now: float):
+        """Drop expired entries. Caller holds the lock."""
+        expired = [key for key, (expires, _) in self._data.items() if expires <= now]
+        for key in expired:
+            _, value = self._data.pop(key)
+            if self.on_evict:
+                self.on_evict(key, value)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            expires, value = self._data[key]
+            if expires <= time.monotonic():
+                del self._data[key]
+                if self.on_evict:
+                    self.on_evict(key, value)
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        with self._lock:
+            now = time.monotonic()
+            self._data[key] = (now + self.ttl, value)
+            self._data.move_to_end(key)
+            self._expire(now)
+            while len(self._data) > self.maxsize:
+                evicted_key, (_, evicted) = self._data.popitem(last=False)
+                if self.on_evict:
+                    self.on_evict(evicted_key, evicted)
+
+    def __delitem__(self, key: Hashable):
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            self._expire(time.monotonic())
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False
+            if entry[0] <= time.monotonic():
+                # Expired: drop it now so a following lookup agrees
+                del self._data[key]
+                if self.on_evict:
+                    self.on_evict(key, entry[1])
+                return False
+            return True
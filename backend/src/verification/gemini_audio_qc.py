@@ -8,8 +8,6 @@ import logging
 import tempfile
 from pathlib import Path
 
-import google.generativeai as genai
-
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +22,7 @@ class AudioQCResult:
     reasoning: str = ""
     suggested_audio_tags: List[str] = None  # e.g., ['excited', 'faster']
     phone_number_ok: Optional[bool] = None  # True/False/None if no phone number
+    error: Optional[str] = None  # Set when the analysis itself failed
 
     def __post_init__(self):
         if self.suggested_audio_tags is None:
@@ -48,7 +47,12 @@ class GeminiAudioQC:
             api_key: Google API key
             model: Gemini model to use (default: gemini-2.0-flash-exp)
         """
+        # Imported here so that importing this module (e.g. for AudioQCResult)
+        # doesn't pay for loading the Gemini SDK
+        import google.generativeai as genai
+
         genai.configure(api_key=api_key)
+        self._genai = genai
         self.model = genai.GenerativeModel(model)
 
         logger.info(f"GeminiAudioQC initialized with model: {model}")
@@ -79,7 +83,7 @@ class GeminiAudioQC:
             logger.info("Uploading audio to Gemini for analysis")
 
             # Upload audio file to Gemini
-            audio_file = genai.upload_file(tmp_path)
+            audio_file = self._genai.upload_file(tmp_path)
 
             # Build the analysis prompt
             prompt = self._build_prompt(original_script, context)
@@ -117,7 +121,8 @@ class GeminiAudioQC:
                 score=0.0,
                 issues=[f"Audio QC error: {str(e)}"],
                 strengths=[],
-                reasoning="Error during audio analysis - flagging for manual review"
+                reasoning="Error during audio analysis - flagging for manual review",
+                error=str(e)
             )
 
     def _build_prompt(
@@ -126,6 +131,8 @@ class GeminiAudioQC:
         context: Optional[dict] = None
     ) -> str:
         """Build analysis prompt for Gemini."""
+        # Cached verdicts are keyed on this prompt: bump _QC_PROMPT_VERSION in
+        # workflow/orchestrator.py when changing it or the response format
         import re
 
         target_duration = context.get('target_duration') if context else None
@@ -3,7 +3,9 @@ Timing adjuster module for calculating optimal speed adjustments
 to achieve target audio durations.
 """
 from dataclasses import dataclass
-from typing import Optional
+from enum import Enum
+from functools import lru_cache
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,89 @@ class TimingAdjustment:
     reason: Optional[str] = None
 
 
+class _Outcome(Enum):
+    """Which branch _compute_speed took, so callers don't match on reason text."""
+
+    INVALID = "invalid"
+    WITHIN_TOLERANCE = "within_tolerance"
+    ADJUSTED = "adjusted"
+    CLAMPED = "clamped"
+
+
+# Inputs are rounded to this many decimals before the cached call, so
+# measurements that differ only by float noise share a cache entry
+_CACHE_DECIMALS = 3
+
+
+def _to_ms(seconds: float) -> int:
+    """Convert seconds to integer milliseconds for exact tolerance comparisons."""
+    return int(round(seconds * 1000))
+
+
+@lru_cache(maxsize=4096)
+def _compute_speed(
+    current_duration: float,
+    target_duration: float,
+    current_speed: float,
+    speed_min: float,
+    speed_max: float,
+    tolerance: float
+) -> Tuple[float, bool, float, Optional[str], _Outcome]:
+    """
+    Pure numeric core of TimingAdjuster.calculate_adjustment.
+
+    Cached because regeneration loops frequently retry with identical inputs;
+    callers round the durations and speed to _CACHE_DECIMALS first.
+
+    Returns:
+        Tuple of (new_speed, is_achievable, deviation, reason, outcome)
+    """
+    if target_duration <= 0:
+        return current_speed, False, 0, "Target duration must be positive", _Outcome.INVALID
+
+    if current_duration <= 0:
+        return current_speed, False, 0, "Current duration must be positive", _Outcome.INVALID
+
+    # Calculate deviation
+    deviation = abs(current_duration - target_duration)
+    tolerance_ms = _to_ms(tolerance)
+
+    # Check if already within tolerance
+    if abs(_to_ms(current_duration) - _to_ms(target_duration)) <= tolerance_ms:
+        return (
+            current_speed, True, deviation, "Already within tolerance", _Outcome.WITHIN_TOLERANCE
+        )
+
+    # Calculate required speed adjustment
+    # If current is longer than target, need to speed up (multiply by >1)
+    # If current is shorter than target, need to slow down (multiply by <1)
+    speed_factor = current_duration / target_duration
+    new_speed = current_speed * speed_factor
+
+    # Check if achievable within ElevenLabs constraints
+    if speed_min <= new_speed <= speed_max:
+        return new_speed, True, deviation, None, _Outcome.ADJUSTED
+
+    # Clamp to nearest boundary
+    clamped_speed = max(speed_min, min(speed_max, new_speed))
+
+    # Calculate estimated duration with clamped speed
+    estimated_duration = current_duration / (clamped_speed / current_speed)
+    estimated_deviation = abs(estimated_duration - target_duration)
+
+    reason = (
+        f"Required speed {new_speed:.2f} outside bounds "
+        f"[{speed_min}, {speed_max}]. "
+        f"Clamped to {clamped_speed:.2f}. "
+        f"Estimated deviation: {estimated_deviation:.2f}s"
+    )
+
+    # Check if clamped speed will still be within tolerance
+    is_achievable = abs(_to_ms(estimated_duration) - _to_ms(target_duration)) <= tolerance_ms
+
+    return clamped_speed, is_achievable, estimated_deviation, reason, _Outcome.CLAMPED
+
+
 class TimingAdjuster:
     """
     Calculates optimal speed adjustments for ElevenLabs TTS
@@ -42,6 +127,7 @@ class TimingAdjuster:
         self.speed_min = speed_min
         self.speed_max = speed_max
         self.tolerance = tolerance
+        self._tolerance_ms = _to_ms(tolerance)
 
         logger.info(
             f"TimingAdjuster initialized: speed range [{speed_min}, {speed_max}], "
@@ -63,16 +149,21 @@ class TimingAdjuster:
         Returns:
             True if within tolerance, False otherwise
         """
-        deviation = abs(actual_duration - target_duration)
-        is_within_tolerance = deviation <= self.tolerance
-
-        logger.debug(
-            f"Timing check: actual={actual_duration:.2f}s, "
-            f"target={target_duration:.2f}s, "
-            f"deviation={deviation:.2f}s, "
-            f"within_tolerance={is_within_tolerance}"
+        # Compare in whole milliseconds so e.g. 15.3s vs 15.0s at ±0.3s
+        # is not rejected by float rounding error
+        is_within_tolerance = (
+            abs(_to_ms(actual_duration) - _to_ms(target_duration)) <= self._tolerance_ms
         )
 
+        if logger.isEnabledFor(logging.DEBUG):
+            deviation = abs(actual_duration - target_duration)
+            logger.debug(
+                f"Timing check: actual={actual_duration:.2f}s, "
+                f"target={target_duration:.2f}s, "
+                f"deviation={deviation:.2f}s, "
+                f"within_tolerance={is_within_tolerance}"
+            )
+
         return is_within_tolerance
 
     def calculate_adjustment(
@@ -103,85 +194,39 @@ class TimingAdjuster:
         Returns:
             TimingAdjustment with new_speed and achievability status
         """
-        if target_duration <= 0:
-            return TimingAdjustment(
-                new_speed=current_speed,
-                is_achievable=False,
-                deviation=0,
-                reason="Target duration must be positive"
-            )
-
-        if current_duration <= 0:
-            return TimingAdjustment(
-                new_speed=current_speed,
-                is_achievable=False,
-                deviation=0,
-                reason="Current duration must be positive"
-            )
-
-        # Calculate deviation
-        deviation = abs(current_duration - target_duration)
-
-        # Check if already within tolerance
-        if deviation <= self.tolerance:
-            logger.info(
-                f"Duration already within tolerance: "
-                f"deviation={deviation:.2f}s <= {self.tolerance}s"
-            )
-            return TimingAdjustment(
-                new_speed=current_speed,
-                is_achievable=True,
-                deviation=deviation,
-                reason="Already within tolerance"
-            )
-
-        # Calculate required speed adjustment
-        # If current is longer than target, need to speed up (multiply by >1)
-        # If current is shorter than target, need to slow down (multiply by <1)
-        speed_factor = current_duration / target_duration
-        new_speed = current_speed * speed_factor
-
-        # Check if achievable within ElevenLabs constraints
-        if self.speed_min <= new_speed <= self.speed_max:
-            logger.info(
-                f"Calculated achievable speed adjustment: "
-                f"current_duration={current_duration:.2f}s, "
-                f"target={target_duration:.2f}s, "
-                f"current_speed={current_speed:.2f}, "
-                f"new_speed={new_speed:.2f}"
-            )
-            return TimingAdjustment(
-                new_speed=new_speed,
-                is_achievable=True,
-                deviation=deviation,
-                reason=None
-            )
-        else:
-            # Clamp to nearest boundary
-            clamped_speed = max(self.speed_min, min(self.speed_max, new_speed))
-
-            # Calculate estimated duration with clamped speed
-            estimated_duration = current_duration / (clamped_speed / current_speed)
-            estimated_deviation = abs(estimated_duration - target_duration)
-
-            reason = (
-                f"Required speed {new_speed:.2f} outside bounds "
-                f"[{self.speed_min}, {self.speed_max}]. "
-                f"Clamped to {clamped_speed:.2f}. "
-                f"Estimated deviation: {estimated_deviation:.2f}s"
-            )
+        new_speed, is_achievable, deviation, reason, outcome = _compute_speed(
+            round(current_duration, _CACHE_DECIMALS),
+            round(target_duration, _CACHE_DECIMALS),
+            round(current_speed, _CACHE_DECIMALS),
+            self.speed_min,
+            self.speed_max,
+            self.tolerance
+        )
 
+        if outcome is _Outcome.WITHIN_TOLERANCE:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Duration already within tolerance: "
+                    f"deviation={deviation:.2f}s <= {self.tolerance}s"
+                )
+        elif outcome is _Outcome.ADJUSTED:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Calculated achievable speed adjustment: "
+                    f"current_duration={current_duration:.2f}s, "
+                    f"target={target_duration:.2f}s, "
+                    f"current_speed={current_speed:.2f}, "
+                    f"new_speed={new_speed:.2f}"
+                )
+        elif outcome is _Outcome.CLAMPED:
             logger.warning(reason)
 
-            # Check if clamped speed will still be within tolerance
-            is_achievable = estimated_deviation <= self.tolerance
-
-            return TimingAdjustment(
-                new_speed=clamped_speed,
-                is_achievable=is_achievable,
-                deviation=estimated_deviation,
-                reason=reason
-            )
+        return TimingAdjustment(
+            new_speed=new_speed,
+            is_achievable=is_achievable,
+            deviation=deviation,
+            reason=reason
+        )
 
     def estimate_duration(
         self,
@@ -207,11 +252,12 @@ class TimingAdjuster:
         base_duration = word_count / words_per_second
         estimated_duration = base_duration / speed
 
-        logger.debug(
-            f"Duration estimate: {word_count} words, "
-            f"speed={speed:.2f}, "
-            f"estimated={estimated_duration:.2f}s"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Duration estimate: {word_count} words, "
+                f"speed={speed:.2f}, "
+                f"estimated={estimated_duration:.2f}s"
+            )
 
         return estimated_duration
 
@@ -3,15 +3,63 @@ Input parser for CSV/Excel files containing voiceover scripts and settings.
 """
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import Iterator, List, Optional, Dict, Tuple
 import logging
 
+import numpy as np
 import pandas as pd
 
+try:
+    import python_calamine  # noqa: F401
+    # pandas exposes the Rust-based calamine reader as an engine from 2.2
+    _EXCEL_ENGINE = (
+        "calamine"
+        if tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+        else None
+    )
+except ImportError:
+    _EXCEL_ENGINE = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _read_excel(file_path: Path, **kwargs) -> pd.DataFrame:
+    """
+    Read an Excel workbook, using the calamine engine when available.
+
+    Falls back to pandas' default engine (openpyxl for .xlsx).
+    """
+    return pd.read_excel(file_path, engine=_EXCEL_ENGINE, **kwargs)
+
+
+# Loader per supported input file extension
+READERS = {
+    ".csv": pd.read_csv,
+    ".xlsx": _read_excel,
+    ".xls": _read_excel,
+}
+
+# Text columns are read as strings so pandas skips type inference for them
+# and IDs such as "123" are not turned into floats ("123.0") when a column
+# has blanks. Numeric columns are left to inference and coerced in
+# _float_column so malformed values become validation errors, not read errors.
+TEXT_COLUMN_DTYPES = {
+    "script_text": str,
+    "output_filename": str,
+    "voice_id": str,
+    "voice_name": str,
+    "notes": str,
+}
+
+# Static validation messages, built once instead of per invalid row
+_MISSING_FIELD_MESSAGES = {
+    column: f"Missing required field: {column}"
+    for column in ("script_text", "target_duration", "output_filename")
+}
+_MISSING_VOICE_MESSAGE = "Either voice_id or voice_name must be provided"
+
+
+@dataclass(slots=True)
 class VoiceoverItem:
     """Represents a single voiceover generation task."""
 
@@ -49,6 +97,150 @@ class VoiceoverItem:
         )
 
 
+@dataclass(eq=False)
+class ParsedBatch:
+    """
+    Column-oriented (structure-of-arrays) view of a parsed input file.
+
+    Each field holds one value per row; VoiceoverItems are built on demand.
+    Batches compare by identity, as field-wise equality is ambiguous for arrays.
+    """
+
+    script_text: np.ndarray  # object
+    target_duration: np.ndarray  # float64
+    output_filename: np.ndarray  # object
+    voice_id: np.ndarray  # object (None if missing)
+    voice_name: np.ndarray  # object (None if missing)
+    stability: np.ndarray  # float64
+    similarity_boost: np.ndarray  # float64
+    style: np.ndarray  # float64
+    speed: np.ndarray  # float64
+    notes: np.ndarray  # object (None if missing)
+    errors: List[List[str]]
+    error_codes: Optional[np.ndarray] = None  # uint32 bitmask, 0 = valid row
+
+    # Row number of the first data row (header row + 1-indexing)
+    first_row_number: int = 2
+    # get_summary() result; the arrays are not modified after parsing
+    _summary: Optional[Dict] = field(default=None, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def __getitem__(self, i: int) -> VoiceoverItem:
+        return self.item(i)
+
+    @property
+    def valid_mask(self) -> np.ndarray:
+        """Boolean array that is True for rows without validation errors."""
+        if self.error_codes is not None:
+            return self.error_codes == 0
+        return np.fromiter((not e for e in self.errors), dtype=bool, count=len(self))
+
+    def item(self, i: int) -> VoiceoverItem:
+        """Build the VoiceoverItem for row index i."""
+        return VoiceoverItem(
+            script_text=self.script_text[i] or "",
+            target_duration=float(self.target_duration[i]),
+            output_filename=self.output_filename[i] or "",
+            voice_id=self.voice_id[i],
+            voice_name=self.voice_name[i],
+            stability=float(self.stability[i]),
+            similarity_boost=float(self.similarity_boost[i]),
+            style=float(self.style[i]),
+            speed=float(self.speed[i]),
+            notes=self.notes[i],
+            row_number=self.first_row_number + i,
+            errors=self.errors[i]
+        )
+
+    def iter_valid(self) -> Iterator[VoiceoverItem]:
+        """Yield VoiceoverItems for valid rows only, building each on demand."""
+        for i in np.flatnonzero(self.valid_mask):
+            yield self.item(int(i))
+
+    def iter_errors(self) -> Iterator[Tuple[int, str]]:
+        """Yield (row_number, error) for every validation error, in row order."""
+        for i, row_errors in enumerate(self.errors):
+            for error in row_errors:
+                yield self.first_row_number + i, error
+
+    def items(self) -> List[VoiceoverItem]:
+        """Build VoiceoverItems for every row."""
+        return [
+            VoiceoverItem(
+                script_text=script or "",
+                target_duration=duration,
+                output_filename=filename or "",
+                voice_id=vid,
+                voice_name=vname,
+                stability=stab,
+                similarity_boost=sim,
+                style=sty,
+                speed=spd,
+                notes=note,
+                row_number=row_number,
+                errors=row_errors
+            )
+            for (
+                script, duration, filename, vid, vname,
+                stab, sim, sty, spd, note, row_number, row_errors
+            ) in zip(
+                self.script_text.tolist(),
+                self.target_duration.tolist(),
+                self.output_filename.tolist(),
+                self.voice_id.tolist(),
+                self.voice_name.tolist(),
+                self.stability.tolist(),
+                self.similarity_boost.tolist(),
+                self.style.tolist(),
+                self.speed.tolist(),
+                self.notes.tolist(),
+                range(self.first_row_number, self.first_row_number + len(self)),
+                self.errors
+            )
+        ]
+
+    def get_summary(self) -> Dict:
+        """
+        Get summary statistics computed directly from the column arrays.
+
+        Computed once per batch; treat the returned dict as read-only.
+
+        Returns:
+            Dictionary with the same keys as InputParser.get_summary
+        """
+        if self._summary is None:
+            self._summary = _duration_summary(
+                len(self), self.target_duration[self.valid_mask]
+            )
+        return self._summary
+
+
+def _duration_summary(total_items: int, valid_durations: np.ndarray) -> Dict:
+    """
+    Build the summary dict from the target durations of the valid items.
+
+    Args:
+        total_items: Number of items including invalid ones
+        valid_durations: float64 array of target_duration for valid items
+
+    Returns:
+        Dictionary with summary statistics
+    """
+    valid_count = int(valid_durations.size)
+
+    return {
+        "total_items": total_items,
+        "valid_items": valid_count,
+        "invalid_items": total_items - valid_count,
+        "total_duration": float(valid_durations.sum()),
+        "avg_duration": float(valid_durations.mean()) if valid_count else 0,
+        "min_duration": float(valid_durations.min()) if valid_count else 0,
+        "max_duration": float(valid_durations.max()) if valid_count else 0,
+    }
+
+
 class InputParser:
     """
     Parser for CSV/Excel files containing voiceover generation tasks.
@@ -66,6 +258,10 @@ class InputParser:
         "notes"
     ]
 
+    # Set views of the column lists for membership tests
+    _REQUIRED_COLUMN_SET = frozenset(REQUIRED_COLUMNS)
+    _KNOWN_COLUMN_SET = frozenset(REQUIRED_COLUMNS + OPTIONAL_COLUMNS)
+
     def __init__(self):
         """Initialize input parser."""
         logger.info("InputParser initialized")
@@ -80,6 +276,26 @@ class InputParser:
         Returns:
             Tuple of (list of VoiceoverItem objects, list of critical errors)
 
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is unsupported
+        """
+        batch, critical_errors = self.parse_batch(file_path)
+        if critical_errors:
+            return [], critical_errors
+
+        return batch.items(), []
+
+    def parse_batch(self, file_path: str) -> Tuple[Optional[ParsedBatch], List[str]]:
+        """
+        Parse CSV or Excel file into a column-oriented ParsedBatch.
+
+        Args:
+            file_path: Path to CSV or Excel file
+
+        Returns:
+            Tuple of (ParsedBatch or None on critical errors, list of critical errors)
+
         Raises:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is unsupported
@@ -91,41 +307,50 @@ class InputParser:
 
         logger.info(f"Parsing input file: {file_path}")
 
-        # Determine file type and load
-        if file_path.suffix.lower() == '.csv':
-            df = pd.read_csv(file_path)
-        elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-            df = pd.read_excel(file_path)
-        else:
+        # Determine file type and load (only columns we know how to use)
+        reader = READERS.get(file_path.suffix.lower())
+        if reader is None:
             raise ValueError(
                 f"Unsupported file format: {file_path.suffix}. "
-                f"Supported formats: .csv, .xlsx, .xls"
+                f"Supported formats: {', '.join(READERS)}"
             )
 
+        df = reader(file_path, usecols=self._is_known_column, dtype=TEXT_COLUMN_DTYPES)
+
         logger.info(f"Loaded {len(df)} rows from {file_path}")
 
         # Validate columns
         critical_errors = self._validate_columns(df)
         if critical_errors:
             logger.error(f"Column validation failed: {critical_errors}")
-            return [], critical_errors
+            return None, critical_errors
+
+        # Parse rows (column-wise; _parse_row is kept for single-row use)
+        batch = self._parse_frame(df)
+
+        # Everything needed now lives in the batch arrays; drop the frame
+        # before logging/summarising so it is not held alongside them
+        del df
 
-        # Parse rows
-        items = []
-        for idx, row in df.iterrows():
-            item = self._parse_row(row, idx + 2)  # +2 for header row and 1-indexing
-            items.append(item)
+        for i, row_errors in enumerate(batch.errors):
+            if row_errors:
+                logger.warning(
+                    f"Row {batch.first_row_number + i} has validation errors: {row_errors}"
+                )
 
-            if not item.is_valid:
-                logger.warning(f"Row {item.row_number} has validation errors: {item.errors}")
+        summary = batch.get_summary()
 
-        valid_count = sum(1 for item in items if item.is_valid)
         logger.info(
-            f"Parsed {len(items)} items: {valid_count} valid, "
-            f"{len(items) - valid_count} with errors"
+            f"Parsed {summary['total_items']} items: "
+            f"{summary['valid_items']} valid, "
+            f"{summary['invalid_items']} with errors"
         )
 
-        return items, []
+        return batch, []
+
+    def _is_known_column(self, column: str) -> bool:
+        """Return True for columns the parser reads; others are skipped at load time."""
+        return column in self._KNOWN_COLUMN_SET
 
     def _validate_columns(self, df: pd.DataFrame) -> List[str]:
         """
@@ -138,13 +363,11 @@ class InputParser:
             List of error messages (empty if valid)
         """
         errors = []
-        missing_columns = []
-
-        for col in self.REQUIRED_COLUMNS:
-            if col not in df.columns:
-                missing_columns.append(col)
+        missing = self._REQUIRED_COLUMN_SET - set(df.columns)
 
-        if missing_columns:
+        if missing:
+            # Report in declaration order so the message is stable
+            missing_columns = [col for col in self.REQUIRED_COLUMNS if col in missing]
             errors.append(
                 f"Missing required columns: {', '.join(missing_columns)}. "
                 f"Required: {', '.join(self.REQUIRED_COLUMNS)}"
@@ -152,6 +375,203 @@ class InputParser:
 
         return errors
 
+    def _parse_frame(self, df: pd.DataFrame) -> ParsedBatch:
+        """
+        Parse every row of a DataFrame into a ParsedBatch.
+
+        Equivalent to calling _parse_row on each row, plus a cross-row
+        duplicate output_filename check. Coercion and validation run on
+        whole columns; error messages are only built for rows that
+        actually fail a check.
+
+        Args:
+            df: DataFrame with validated columns
+
+        Returns:
+            ParsedBatch (rows may contain validation errors)
+        """
+        n = len(df)
+
+        # One NA test over the whole frame, sliced per column below
+        na_mask = df.isna().to_numpy()
+        na_columns = {column: na_mask[:, j] for j, column in enumerate(df.columns)}
+
+        # Extract required fields
+        script_text, script_missing = self._string_column(df, "script_text", na_columns)
+        target_duration, duration_raw, duration_missing, duration_invalid = (
+            self._float_column(df, "target_duration", na_columns)
+        )
+        output_filename, filename_missing = self._string_column(df, "output_filename", na_columns)
+
+        # Extract optional fields
+        voice_id, _ = self._string_column(df, "voice_id", na_columns)
+        voice_name, _ = self._string_column(df, "voice_name", na_columns)
+        notes, _ = self._string_column(df, "notes", na_columns)
+
+        numeric = {}
+        for column, default in (
+            ("stability", 0.5),
+            ("similarity_boost", 0.75),
+            ("style", 0.0),
+            ("speed", 1.0),
+        ):
+            values, raw, missing, invalid = self._float_column(df, column, na_columns)
+            values[missing | invalid] = default
+            numeric[column] = (values, raw, invalid)
+
+        stability = numeric["stability"][0]
+        similarity_boost = numeric["similarity_boost"][0]
+        style = numeric["style"][0]
+        speed = numeric["speed"][0]
+
+        # Validation masks, in the same order _parse_row reports them. Messages
+        # are static strings or callables taking the row index for formatted ones
+        checks = [
+            (script_missing, _MISSING_FIELD_MESSAGES["script_text"]),
+            (duration_missing, _MISSING_FIELD_MESSAGES["target_duration"]),
+            (duration_invalid,
+             lambda i: f"Invalid number for target_duration: {duration_raw.iat[i]}"),
+            (filename_missing, _MISSING_FIELD_MESSAGES["output_filename"]),
+        ]
+        for column in ("stability", "similarity_boost", "style", "speed"):
+            _, raw, invalid = numeric[column]
+            checks.append(
+                (invalid, lambda i, c=column, r=raw: f"Invalid number for {c}: {r.iat[i]}")
+            )
+
+        with np.errstate(invalid='ignore'):
+            checks.extend([
+                (target_duration <= 0,
+                 lambda i: f"target_duration must be positive (got {target_duration[i]})"),
+                ((stability < 0) | (stability > 1),
+                 lambda i: f"stability must be between 0 and 1 (got {stability[i]})"),
+                ((similarity_boost < 0) | (similarity_boost > 1),
+                 lambda i: f"similarity_boost must be between 0 and 1 (got {similarity_boost[i]})"),
+                ((style < 0) | (style > 1),
+                 lambda i: f"style must be between 0 and 1 (got {style[i]})"),
+                ((speed < 0.25) | (speed > 2.0),
+                 lambda i: f"speed must be between 0.25 and 2.0 (got {speed[i]})"),
+            ])
+
+        checks.append((
+            pd.isna(voice_id) & pd.isna(voice_name),
+            _MISSING_VOICE_MESSAGE
+        ))
+
+        # Pack all checks into one bit per check, so rows are classified with
+        # a single integer array and messages are only formatted for failures
+        error_codes = np.zeros(n, dtype=np.uint32)
+        for bit, (mask, _) in enumerate(checks):
+            error_codes |= mask.astype(np.uint32) << np.uint32(bit)
+
+        # Rows are generated concurrently, so two rows writing the same file
+        # would race; reject later reuses of an output_filename among rows
+        # that are otherwise valid. This is a cross-row rule _parse_row can't see
+        valid = error_codes == 0
+        duplicate = np.zeros(n, dtype=bool)
+        duplicate[valid] = pd.Series(output_filename[valid]).duplicated().to_numpy()
+        checks.append(
+            (duplicate, lambda i: f"Duplicate output_filename: {output_filename[i]}")
+        )
+        error_codes |= duplicate.astype(np.uint32) << np.uint32(len(checks) - 1)
+
+        errors = [[] for _ in range(n)]
+        for i in np.flatnonzero(error_codes):
+            code = int(error_codes[i])
+            errors[i] = [
+                message if isinstance(message, str) else message(i)
+                for bit, (_, message) in enumerate(checks)
+                if code >> bit & 1
+            ]
+
+        # Match _parse_row's `value or default` fallbacks
+        target_duration = np.nan_to_num(target_duration, nan=0.0)
+        stability[stability == 0] = 0.5
+        similarity_boost[similarity_boost == 0] = 0.75
+        speed[speed == 0] = 1.0
+
+        return ParsedBatch(
+            script_text=script_text,
+            target_duration=target_duration,
+            output_filename=output_filename,
+            voice_id=voice_id,
+            voice_name=voice_name,
+            stability=stability,
+            similarity_boost=similarity_boost,
+            style=style,
+            speed=speed,
+            notes=notes,
+            errors=errors,
+            error_codes=error_codes
+        )
+
+    def _string_column(
+        self,
+        df: pd.DataFrame,
+        column: str,
+        na_columns: Dict[str, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract a stripped string column.
+
+        Args:
+            df: Source DataFrame
+            column: Column name
+            na_columns: Precomputed NA mask per column
+
+        Returns:
+            Tuple of (object array with None for missing/blank values,
+            boolean mask of missing/blank values)
+        """
+        if column not in df.columns:
+            return np.full(len(df), None, dtype=object), np.ones(len(df), dtype=bool)
+
+        series = df[column]
+        values = series.astype(str).str.strip().to_numpy(dtype=object)
+        # Whitespace-only cells count as missing, as the calamine reader
+        # already returns them as NaN
+        missing = na_columns[column] | (values == "")
+        values[missing] = None
+
+        return values, missing
+
+    def _float_column(
+        self,
+        df: pd.DataFrame,
+        column: str,
+        na_columns: Dict[str, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Extract a numeric column, coercing unparseable values to NaN.
+
+        Args:
+            df: Source DataFrame
+            column: Column name
+            na_columns: Precomputed NA mask per column
+
+        Returns:
+            Tuple of (float64 array, raw Series (None if the column is
+            absent), boolean mask of missing values, boolean mask of values
+            that failed to parse)
+        """
+        n = len(df)
+        if column not in df.columns:
+            return (
+                np.full(n, np.nan),
+                None,
+                np.ones(n, dtype=bool),
+                np.zeros(n, dtype=bool)
+            )
+
+        series = df[column]
+        missing = na_columns[column]
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float, copy=True)
+        invalid = np.isnan(values) & ~missing
+
+        # Raw values are only read back for the few rows that failed to parse,
+        # so hand back the Series rather than copying it to an object array
+        return values, series, missing, invalid
+
     def _parse_row(self, row: pd.Series, row_number: int) -> VoiceoverItem:
         """
         Parse a single row into a VoiceoverItem.
@@ -206,7 +626,7 @@ class InputParser:
             errors.append(f"speed must be between 0.25 and 2.0 (got {speed})")
 
         if not voice_id and not voice_name:
-            errors.append("Either voice_id or voice_name must be provided")
+            errors.append(_MISSING_VOICE_MESSAGE)
 
         # Create item
         item = VoiceoverItem(
@@ -243,12 +663,16 @@ class InputParser:
         Returns:
             String value or None if missing/invalid
         """
-        if column not in row or pd.isna(row[column]):
-            errors.append(f"Missing required field: {column}")
+        value = (
+            None if column not in row or pd.isna(row[column])
+            else str(row[column]).strip()
+        )
+
+        if not value:
+            errors.append(_MISSING_FIELD_MESSAGES.get(column) or f"Missing required field: {column}")
             return None
 
-        value = str(row[column]).strip()
-        return value if value else None
+        return value
 
     def _get_float_value(
         self,
@@ -272,7 +696,7 @@ class InputParser:
         if column not in row or pd.isna(row[column]):
             if default is not None:
                 return default
-            errors.append(f"Missing required field: {column}")
+            errors.append(_MISSING_FIELD_MESSAGES.get(column) or f"Missing required field: {column}")
             return None
 
         try:
@@ -313,28 +737,26 @@ class InputParser:
             Tuple of (is_valid, errors, summary_stats)
         """
         try:
-            items, critical_errors = self.parse_file(file_path)
+            # Work off the column batch so no VoiceoverItems are built
+            batch, critical_errors = self.parse_batch(file_path)
 
             if critical_errors:
                 return False, critical_errors, {}
 
-            valid_items = [item for item in items if item.is_valid]
-            invalid_items = [item for item in items if not item.is_valid]
-
             # Collect all errors
-            all_errors = []
-            for item in invalid_items:
-                for error in item.errors:
-                    all_errors.append(f"Row {item.row_number}: {error}")
+            all_errors = [
+                f"Row {row_number}: {error}"
+                for row_number, error in batch.iter_errors()
+            ]
 
+            # Memoized on the batch by parse_batch's log line
+            full_summary = batch.get_summary()
             summary = {
-                "total_items": len(items),
-                "valid_items": len(valid_items),
-                "invalid_items": len(invalid_items),
-                "total_duration": sum(item.target_duration for item in valid_items),
+                key: full_summary[key]
+                for key in ("total_items", "valid_items", "invalid_items", "total_duration")
             }
 
-            is_valid = len(invalid_items) == 0
+            is_valid = summary["invalid_items"] == 0
 
             logger.info(
                 f"File validation: {summary['valid_items']}/{summary['total_items']} valid"
@@ -356,23 +778,9 @@ class InputParser:
         Returns:
             Dictionary with summary statistics
         """
-        valid_items = [item for item in items if item.is_valid]
-
-        return {
-            "total_items": len(items),
-            "valid_items": len(valid_items),
-            "invalid_items": len(items) - len(valid_items),
-            "total_duration": sum(item.target_duration for item in valid_items),
-            "avg_duration": (
-                sum(item.target_duration for item in valid_items) / len(valid_items)
-                if valid_items else 0
-            ),
-            "min_duration": (
-                min(item.target_duration for item in valid_items)
-                if valid_items else 0
-            ),
-            "max_duration": (
-                max(item.target_duration for item in valid_items)
-                if valid_items else 0
-            ),
-        }
+        valid_durations = np.fromiter(
+            (item.target_duration for item in items if item.is_valid),
+            dtype=np.float64
+        )
+
+        return _duration_summary(len(items), valid_durations)
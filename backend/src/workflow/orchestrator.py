@@ -1,27 +1,97 @@
 """
 Main workflow orchestrator for coordinating voiceover generation.
 """
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, NamedTuple, Tuple
 from datetime import datetime
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
 import logging
+import shelve
+import threading
+import time
 import uuid
-import tempfile
 
 from backend.config.settings import Config
 from backend.src.api.elevenlabs_client import ElevenLabsClient
 from backend.src.api.retry_strategy import RetryStrategy
-from backend.src.audio.processor import AudioProcessor
-from backend.src.audio.quality_checker import QualityChecker
+from backend.src.audio.processor import AudioProcessor, AudioBlob
+from backend.src.audio.quality_checker import QualityChecker, QualityReport
 from backend.src.verification.timing_adjuster import TimingAdjuster
-from backend.src.verification.gemini_audio_qc import GeminiAudioQC
+from backend.src.verification.gemini_audio_qc import GeminiAudioQC, AudioQCResult
 from backend.src.workflow.input_parser import InputParser, VoiceoverItem
 from backend.src.workflow.output_manager import OutputManager, GenerationResult, BatchResult
+from backend.src.workflow.rate_limiter import TokenBucket
 from backend.src.utils.logger import ProgressLogger
+from backend.src.utils.ttl_cache import TTLCache
 from backend.src.utils.text_preprocessor import TextPreprocessor
 
 logger = logging.getLogger(__name__)
 
+# Serializes access to the on-disk QC result cache; shelve is not safe for
+# concurrent use and the web app runs several orchestrators at once
+_RESULT_CACHE_LOCK = threading.Lock()
+
+# Part of every QC cache key. Bump when GeminiAudioQC's prompt or response
+# parsing changes so verdicts from the old prompt aren't served
+_QC_PROMPT_VERSION = 1
+
+# Bounds for each orchestrator's in-memory QC results; cached orchestrators
+# live as long as the web app, so this must not grow with every batch
+_AUDIO_QC_MEMO_SIZE = 1024
+_AUDIO_QC_MEMO_TTL = 3600
+
+# Provider rate limits are per account, not per orchestrator: the web app
+# keeps one orchestrator per model, so they all draw from shared buckets
+_RATE_LIMITERS: Dict[Tuple[str, int], TokenBucket] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def _shared_bucket(provider: str, budget_per_minute: int) -> TokenBucket:
+    """
+    Get the process-wide token bucket for a provider budget.
+
+    Args:
+        provider: Provider name, e.g. 'elevenlabs'
+        budget_per_minute: Tokens (or characters) allowed per minute
+
+    Returns:
+        TokenBucket shared by every orchestrator using this budget
+    """
+    key = (provider, budget_per_minute)
+    with _RATE_LIMITERS_LOCK:
+        bucket = _RATE_LIMITERS.get(key)
+        if bucket is None:
+            bucket = TokenBucket(
+                capacity=budget_per_minute,
+                refill_rate=budget_per_minute / 60
+            )
+            _RATE_LIMITERS[key] = bucket
+        return bucket
+
+
+class ProgressEvent(NamedTuple):
+    """Progress update passed to process_batch's progress_callback."""
+
+    current: int
+    total: int
+    item: GenerationResult
+
+
+@dataclass(slots=True)
+class BestAttempt:
+    """Closest-to-target attempt seen so far for an item."""
+
+    audio: AudioBlob
+    actual_duration: float
+    attempt_number: int
+    speed: float
+    # Filled in if this attempt reaches quality checks
+    quality_report: Optional[QualityReport] = None
+    audio_qc_result: Optional[AudioQCResult] = None
+
 
 class VoiceoverOrchestrator:
     """
@@ -85,18 +155,28 @@ class VoiceoverOrchestrator:
             tolerance=self.config.DURATION_TOLERANCE
         )
 
-        # Initialize Gemini audio quality checker if enabled (audio-based)
+        # Gemini audio quality checker (audio-based); the client itself is
+        # created on first use, see the gemini_audio_qc property
         self.audio_qc_enabled = self.config.ENABLE_AUDIO_QC and self.config.GOOGLE_API_KEY
         if self.audio_qc_enabled:
-            self.gemini_audio_qc = GeminiAudioQC(
-                api_key=self.config.GOOGLE_API_KEY,
-                model=self.config.GEMINI_MODEL
-            )
             logger.info("Audio Quality Control (Gemini) enabled")
-        else:
-            self.gemini_audio_qc = None
-            if not self.config.GOOGLE_API_KEY:
-                logger.warning("Audio QC disabled: GOOGLE_API_KEY not set")
+        elif not self.config.GOOGLE_API_KEY:
+            logger.warning("Audio QC disabled: GOOGLE_API_KEY not set")
+        self.defer_audio_qc = bool(self.audio_qc_enabled and self.config.DEFERRED_AUDIO_QC)
+
+        # Per-provider rate limiters, shared across worker threads and
+        # with every other orchestrator in the process
+        self._elevenlabs_bucket = _shared_bucket(
+            'elevenlabs', self.config.ELEVENLABS_CHARS_PER_MINUTE
+        )
+        self._gemini_bucket = _shared_bucket('gemini', self.config.GEMINI_TOKENS_PER_MINUTE)
+
+        # Voice name -> voice ID, filled from the account's voice list on first use
+        self._voice_name_cache: Optional[Dict[str, Optional[str]]] = None
+        self._voice_cache_lock = threading.Lock()
+
+        # Gemini QC results keyed by (script/context hash, audio hash)
+        self._audio_qc_cache = TTLCache(maxsize=_AUDIO_QC_MEMO_SIZE, ttl=_AUDIO_QC_MEMO_TTL)
 
         self.input_parser = InputParser()
 
@@ -110,11 +190,22 @@ class VoiceoverOrchestrator:
 
         logger.info("VoiceoverOrchestrator initialized successfully")
 
+    @cached_property
+    def gemini_audio_qc(self) -> Optional[GeminiAudioQC]:
+        """Gemini audio checker, created on first access (None if QC is disabled)."""
+        if not self.audio_qc_enabled:
+            return None
+
+        return GeminiAudioQC(
+            api_key=self.config.GOOGLE_API_KEY,
+            model=self.config.GEMINI_MODEL
+        )
+
     def process_batch(
         self,
         input_file: str,
         max_retries: Optional[int] = None,
-        progress_callback: Optional[Callable] = None,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
         batch_id: Optional[str] = None
     ) -> BatchResult:
         """
@@ -123,7 +214,8 @@ class VoiceoverOrchestrator:
         Args:
             input_file: Path to CSV or Excel input file
             max_retries: Override config max retries
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback, called with a ProgressEvent
+                after each item
             batch_id: Optional batch ID (generated if not provided)
 
         Returns:
@@ -139,18 +231,18 @@ class VoiceoverOrchestrator:
         batch_id = batch_id or str(uuid.uuid4())[:8]
 
         # Parse input file
-        items, critical_errors = self.input_parser.parse_file(input_file)
+        parsed_batch, critical_errors = self.input_parser.parse_batch(input_file)
 
         if critical_errors:
             raise ValueError(f"Invalid input file: {'; '.join(critical_errors)}")
 
-        # Filter out invalid items
-        valid_items = [item for item in items if item.is_valid]
-        invalid_items = [item for item in items if not item.is_valid]
+        # Only valid rows are turned into VoiceoverItems
+        valid_items = list(parsed_batch.iter_valid())
+        invalid_count = len(parsed_batch) - len(valid_items)
 
-        if invalid_items:
+        if invalid_count:
             logger.warning(
-                f"Skipping {len(invalid_items)} invalid items. "
+                f"Skipping {invalid_count} invalid items. "
                 f"Check logs for details."
             )
 
@@ -162,6 +254,10 @@ class VoiceoverOrchestrator:
             total_items=len(valid_items)
         )
 
+        # Orchestrators can be reused across batches, so look voices up afresh
+        with self._voice_cache_lock:
+            self._voice_name_cache = None
+
         # Initialize progress logger
         progress = ProgressLogger(
             total_items=len(valid_items),
@@ -169,58 +265,463 @@ class VoiceoverOrchestrator:
             log_interval=5
         )
 
-        # Process each item
-        for item in valid_items:
-            logger.info(f"Processing: {item.output_filename}")
+        # Process items. API calls are I/O-bound, so items run on a thread
+        # pool; concurrency of 1 keeps the plain sequential loop for debugging.
+        max_workers = self.config.MAX_CONCURRENT_REQUESTS
+        ordered_results = [None] * len(valid_items)
+        record_lock = threading.Lock()
+
+        if max_workers <= 1:
+            for index, item in enumerate(valid_items):
+                ordered_results[index] = self._process_and_record(
+                    item, batch_result, progress, progress_callback,
+                    max_retries, record_lock
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._process_and_record,
+                        item, batch_result, progress, progress_callback,
+                        max_retries, record_lock
+                    ): index
+                    for index, item in enumerate(valid_items)
+                }
+                for future in as_completed(futures):
+                    ordered_results[futures[future]] = future.result()
+
+        # Keep results in input order for reports
+        batch_result.results = ordered_results
+
+        if self.defer_audio_qc:
+            self._run_deferred_audio_qc(valid_items, batch_result)
+
+        # Log final summary
+        logger.info(progress.get_summary())
+        logger.info(f"\n{batch_result.get_summary()}")
+
+        # Generate report
+        self.output_manager.generate_reports(batch_result, formats=('csv', 'json'))
+
+        return batch_result
+
+    def _resolve_voice_id(self, voice_name: str) -> Optional[str]:
+        """
+        Resolve a voice name to its ID, caching results for the batch.
+
+        The first lookup fetches the account's voice list once; repeated
+        names (and unknown names) are then answered without API calls.
+
+        Args:
+            voice_name: Voice name to look up (case-insensitive)
+
+        Returns:
+            Voice ID if found, None otherwise
+        """
+        key = voice_name.lower()
+
+        with self._voice_cache_lock:
+            if self._voice_name_cache is None:
+                try:
+                    voices = self.api_client.get_available_voices()
+                except Exception as e:
+                    logger.error(f"Could not prefetch voices: {e}")
+                    return self.api_client.get_voice_by_name(voice_name)
+
+                # First match wins, as in get_voice_by_name
+                self._voice_name_cache = {}
+                for voice in voices:
+                    self._voice_name_cache.setdefault(voice["name"].lower(), voice["id"])
+
+            if key not in self._voice_name_cache:
+                logger.warning(f"Voice '{voice_name}' not found")
+                self._voice_name_cache[key] = None
+
+            return self._voice_name_cache[key]
+
+    def _run_quality_checks(
+        self,
+        audio: AudioBlob,
+        item: VoiceoverItem
+    ) -> Tuple[QualityReport, Optional[AudioQCResult]]:
+        """
+        Run local quality checks and Gemini audio QC.
+
+        The two are independent, so when Gemini QC is enabled its remote
+        call runs on a helper thread while the local checks decode and
+        analyze the audio.
+
+        Args:
+            audio: Audio to check
+            item: VoiceoverItem the audio was generated for
+
+        Returns:
+            Tuple of (QualityReport, AudioQCResult or None if QC disabled)
+        """
+        metadata = {'target_duration': item.target_duration}
+
+        if not self.audio_qc_enabled or self.defer_audio_qc:
+            return self.quality_checker.run_all_checks(audio.data, metadata=metadata), None
+
+        logger.info("Running Gemini audio quality control")
+        with ThreadPoolExecutor(max_workers=1) as qc_executor:
+            audio_qc_future = qc_executor.submit(self._run_audio_qc, audio, item)
+            quality_report = self.quality_checker.run_all_checks(audio.data, metadata=metadata)
+            audio_qc_result = audio_qc_future.result()
+
+        return quality_report, audio_qc_result
+
+    def _run_deferred_audio_qc(
+        self,
+        items: List[VoiceoverItem],
+        batch_result: BatchResult
+    ):
+        """
+        Run Gemini audio QC for every saved file of a finished batch.
+
+        Requests are issued concurrently (bounded by MAX_CONCURRENT_REQUESTS
+        and the Gemini rate limiter). Completed items that QC fails or flags
+        are moved to needs_review, matching the per-attempt behaviour.
+
+        Args:
+            items: Valid items, in the same order as batch_result.results
+            batch_result: Batch result to update in place
+        """
+        pending = [
+            (item, result)
+            for item, result in zip(items, batch_result.results)
+            if result.audio_path and result.audio_qc_status is None
+        ]
+        if not pending:
+            return
+
+        logger.info(f"Running deferred Gemini audio QC for {len(pending)} files")
+
+        def analyze(item: VoiceoverItem, result: GenerationResult) -> AudioQCResult:
+            # Read back from disk so the batch's audio isn't all held in memory
+            audio = AudioBlob(Path(result.audio_path).read_bytes(), result.final_duration)
+            return self._run_audio_qc(audio, item)
+
+        moves = []
+        with ThreadPoolExecutor(max_workers=max(1, self.config.MAX_CONCURRENT_REQUESTS)) as executor:
+            futures = {
+                executor.submit(analyze, item, result): result
+                for item, result in pending
+            }
+            for future in as_completed(futures):
+                result = futures[future]
+                try:
+                    audio_qc_result = future.result()
+                except Exception as e:
+                    logger.error(f"Deferred audio QC failed for {result.filename}: {e}")
+                    continue
+
+                result.audio_qc_status = audio_qc_result.status
+                result.audio_qc_score = audio_qc_result.score
+                result.audio_qc_issues = audio_qc_result.issues
+                result.audio_qc_strengths = audio_qc_result.strengths
+                result.audio_qc_guidance = audio_qc_result.guidance
+
+                if result.status != 'completed' or audio_qc_result.status == 'pass':
+                    continue
+
+                if audio_qc_result.status == 'fail':
+                    result.issues.append(f"Audio QC failed: {audio_qc_result.reasoning}")
+                else:
+                    result.issues.append(f"Audio QC flagged for review: {audio_qc_result.reasoning}")
+
+                batch_result.update_status(result, 'needs_review')
+                moves.append((result, Path(result.audio_path)))
+
+        # Move downgraded files to needs_review together once QC is done
+        for (result, _), new_path in zip(moves, self.output_manager.organize_many(moves)):
+            if new_path is not None:
+                result.audio_path = new_path
+
+    def _run_audio_qc(
+        self,
+        audio: AudioBlob,
+        item: VoiceoverItem
+    ) -> AudioQCResult:
+        """
+        Run Gemini audio QC, reusing the result if these exact bytes were
+        already analyzed for this script (e.g. best-attempt fallback).
+
+        Args:
+            audio: Audio to analyze
+            item: VoiceoverItem the audio was generated for
+
+        Returns:
+            AudioQCResult from Gemini or the cache
+        """
+        script_key = hashlib.blake2b(
+            f"{self.config.GEMINI_MODEL}\0{_QC_PROMPT_VERSION}\0"
+            f"{item.script_text}\0{item.target_duration}\0{item.notes}".encode(),
+            digest_size=16
+        ).digest()
+        key = (script_key, audio.digest())
+
+        cached = self._audio_qc_cache.get(key)
+        if cached is None:
+            cached = self._load_cached_result(key)
+        if cached is not None:
+            logger.info("Reusing Gemini audio QC result for identical audio")
+            return cached
+
+        self._gemini_bucket.acquire(
+            self._estimate_gemini_tokens(
+                audio.duration(self.audio_processor), item.script_text
+            )
+        )
+        result = self.gemini_audio_qc.analyze_audio(
+            audio_data=audio.data,
+            original_script=item.script_text,
+            context={
+                'target_duration': item.target_duration,
+                'notes': item.notes
+            }
+        )
+
+        self._audio_qc_cache[key] = result
+
+        # Don't persist failed analyses; a later run should retry them
+        if result.error is None:
+            self._store_cached_result(key, result)
+
+        return result
+
+    def _result_cache_path(self) -> Optional[Path]:
+        """Path of the on-disk QC result cache, or None if disabled."""
+        if not self.config.ENABLE_RESULT_CACHE:
+            return None
+        return Path(self.config.CACHE_DIR) / "qc_results"
+
+    def _load_cached_result(self, key: Tuple[bytes, bytes]) -> Optional[AudioQCResult]:
+        """
+        Look up a QC result in the on-disk cache.
+
+        Args:
+            key: (script hash, audio hash) cache key
+
+        Returns:
+            Cached AudioQCResult, or None on a miss or if the cache is unavailable
+        """
+        cache_path = self._result_cache_path()
+        if cache_path is None:
+            return None
+
+        try:
+            with _RESULT_CACHE_LOCK, shelve.open(str(cache_path), flag='r') as cache:
+                entry = cache.get(b''.join(key).hex())
+        except Exception as e:
+            # Missing, locked or unreadable cache is just a miss
+            logger.debug(f"QC result cache unavailable: {e}")
+            return None
+
+        # Entries are (stored_at, result); anything else predates expiry
+        if not isinstance(entry, tuple) or len(entry) != 2:
+            return None
+        stored_at, result = entry
+        if time.time() - stored_at > self.config.RESULT_CACHE_TTL_SECONDS:
+            return None
+
+        self._audio_qc_cache[key] = result
+        return result
+
+    def _store_cached_result(self, key: Tuple[bytes, bytes], result: AudioQCResult):
+        """
+        Save a QC result to the on-disk cache (best effort).
+
+        Args:
+            key: (script hash, audio hash) cache key
+            result: AudioQCResult to store
+        """
+        cache_path = self._result_cache_path()
+        if cache_path is None:
+            return
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with _RESULT_CACHE_LOCK, shelve.open(str(cache_path)) as cache:
+                cache[b''.join(key).hex()] = (time.time(), result)
+                if len(cache) > self.config.RESULT_CACHE_MAX_ENTRIES:
+                    self._prune_result_cache(cache)
+        except Exception as e:
+            logger.warning(f"Could not write QC result cache: {e}")
+
+    def _prune_result_cache(self, cache: shelve.Shelf):
+        """
+        Drop expired entries, then the oldest, until the cache is under its limit.
+
+        Prunes to 90% of RESULT_CACHE_MAX_ENTRIES so the full scan doesn't
+        run again on the very next store. Caller holds _RESULT_CACHE_LOCK.
 
+        Args:
+            cache: Open, writable result cache
+        """
+        now = time.time()
+        ages = []
+        for cache_key in list(cache.keys()):
             try:
-                # Process single item
-                result = self.process_single_item(
-                    item,
-                    max_retries=max_retries
-                )
+                entry = cache[cache_key]
+                stored_at = entry[0] if isinstance(entry, tuple) else 0.0
+            except Exception:
+                stored_at = 0.0  # Unreadable entry: drop it first
+            if now - stored_at > self.config.RESULT_CACHE_TTL_SECONDS:
+                del cache[cache_key]
+            else:
+                ages.append((stored_at, cache_key))
+
+        target = int(self.config.RESULT_CACHE_MAX_ENTRIES * 0.9)
+        if len(ages) > target:
+            ages.sort()
+            for _, cache_key in ages[:len(ages) - target]:
+                del cache[cache_key]
+
+        logger.debug(f"Pruned QC result cache to {min(len(ages), target)} entries")
+
+    @staticmethod
+    def _estimate_gemini_tokens(audio_duration: float, script_text: str) -> int:
+        """
+        Estimate Gemini input tokens for an audio QC request.
 
-                # Add to batch result
-                batch_result.add_result(result)
+        Gemini bills audio at 32 tokens per second; text is roughly
+        4 characters per token. A flat allowance covers the prompt.
 
-                # Update progress
-                progress.log_progress(
-                    success=(result.status == 'completed'),
-                    item_name=item.output_filename
-                )
+        Args:
+            audio_duration: Audio length in seconds
+            script_text: Script sent alongside the audio
 
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(
-                        current=progress.processed_items,
-                        total=progress.total_items,
-                        item=result
-                    )
+        Returns:
+            Estimated token count
+        """
+        return int(audio_duration * 32) + len(script_text) // 4 + 500
 
-            except Exception as e:
-                logger.error(f"Failed to process {item.output_filename}: {e}")
+    def _process_and_record(
+        self,
+        item: VoiceoverItem,
+        batch_result: BatchResult,
+        progress: ProgressLogger,
+        progress_callback: Optional[Callable[[ProgressEvent], None]],
+        max_retries: Optional[int],
+        lock: threading.Lock
+    ) -> GenerationResult:
+        """
+        Process one item and record its result on the batch.
 
-                # Create failed result
-                result = GenerationResult(
-                    filename=item.output_filename,
-                    status='failed',
-                    attempts=0,
-                    target_duration=item.target_duration,
-                    error=str(e)
+        Args:
+            item: VoiceoverItem to process
+            batch_result: BatchResult to add the result to
+            progress: ProgressLogger tracking the batch
+            progress_callback: Optional callback for progress updates
+            max_retries: Override config max retries
+            lock: Lock guarding batch_result, progress and the callback
+
+        Returns:
+            GenerationResult for the item
+        """
+        logger.info(f"Processing: {item.output_filename}")
+
+        try:
+            result = self.process_single_item(item, max_retries=max_retries)
+        except Exception as e:
+            logger.error(f"Failed to process {item.output_filename}: {e}")
+
+            # Create failed result
+            result = GenerationResult(
+                filename=item.output_filename,
+                status='failed',
+                attempts=0,
+                target_duration=item.target_duration,
+                error=str(e)
+            )
+
+        with lock:
+            batch_result.add_result(result)
+            progress.log_progress(
+                success=(result.status == 'completed'),
+                item_name=item.output_filename
+            )
+
+            if progress_callback:
+                progress_callback(
+                    ProgressEvent(progress.processed_items, progress.total_items, result)
                 )
 
-                batch_result.add_result(result)
-                progress.log_progress(success=False, item_name=item.output_filename)
+        return result
 
-        # Log final summary
-        logger.info(progress.get_summary())
-        logger.info(f"\n{batch_result.get_summary()}")
+    def _finalize_attempt(
+        self,
+        item: VoiceoverItem,
+        audio: AudioBlob,
+        actual_duration: float,
+        attempts: int,
+        quality_report: QualityReport,
+        audio_qc_result: Optional[AudioQCResult],
+        issues: List[str],
+        qc_suggested_tags: List[str]
+    ) -> GenerationResult:
+        """
+        Decide the final status of an attempt within timing, save it and
+        build its result.
 
-        # Generate report
-        self.output_manager.generate_report(batch_result, format='csv')
-        self.output_manager.generate_report(batch_result, format='json')
+        Args:
+            item: VoiceoverItem being processed
+            audio: Audio of the attempt to keep
+            actual_duration: Duration of that audio in seconds
+            attempts: Number of attempts made for the item
+            quality_report: Quality checks for the audio
+            audio_qc_result: Gemini audio QC for the audio, if run
+            issues: Issues collected so far, may contain duplicates (extended in place)
+            qc_suggested_tags: Audio tags suggested by QC for retries
 
-        return batch_result
+        Returns:
+            GenerationResult for the item
+        """
+        # Determine final status based on all checks
+        if quality_report.passed:
+            status = 'completed'
+
+            # Check Audio QC if available
+            if audio_qc_result:
+                if audio_qc_result.status == 'fail':
+                    status = 'needs_review'
+                    issues.append(f"Audio QC failed: {audio_qc_result.reasoning}")
+                elif audio_qc_result.status == 'flag':
+                    status = 'needs_review'
+                    issues.append(f"Audio QC flagged for review: {audio_qc_result.reasoning}")
+        else:
+            status = 'needs_review'
+            if quality_report.issues:
+                issues.extend(quality_report.issues)
+
+        # Save audio with script text as metadata
+        audio_path = self.output_manager.save_audio(
+            audio.data,
+            item.output_filename,
+            status=status,
+            script_text=item.script_text
+        )
+
+        # Create result
+        return GenerationResult(
+            filename=item.output_filename,
+            status=status,
+            attempts=attempts,
+            final_duration=actual_duration,
+            target_duration=item.target_duration,
+            duration_diff=actual_duration - item.target_duration,
+            quality_passed=quality_report.passed,
+            issues=list(dict.fromkeys(issues)),
+            notes=item.notes or "",
+            audio_path=audio_path,
+            audio_qc_status=audio_qc_result.status if audio_qc_result else None,
+            audio_qc_score=audio_qc_result.score if audio_qc_result else None,
+            audio_qc_issues=audio_qc_result.issues if audio_qc_result else [],
+            audio_qc_strengths=audio_qc_result.strengths if audio_qc_result else [],
+            audio_qc_guidance=audio_qc_result.guidance if audio_qc_result else None,
+            audio_qc_suggested_tags=qc_suggested_tags
+        )
 
     def process_single_item(
         self,
@@ -242,16 +743,20 @@ class VoiceoverOrchestrator:
         current_speed = item.speed
         issues = []
 
+        # Read once; used throughout the retry loop and in every result
+        target_duration = item.target_duration
+        notes = item.notes or ""
+
         # Resolve voice ID if only name provided
         voice_id = item.voice_id
         if not voice_id and item.voice_name:
-            voice_id = self.api_client.get_voice_by_name(item.voice_name)
+            voice_id = self._resolve_voice_id(item.voice_name)
             if not voice_id:
                 return GenerationResult(
                     filename=item.output_filename,
                     status='failed',
                     attempts=0,
-                    target_duration=item.target_duration,
+                    target_duration=target_duration,
                     error=f"Voice '{item.voice_name}' not found"
                 )
 
@@ -260,40 +765,38 @@ class VoiceoverOrchestrator:
         original_script_text = self.text_preprocessor.preprocess(item.script_text)
 
         # Track best attempt across all retries
-        best_attempt = None
+        best_attempt: Optional[BestAttempt] = None
         best_duration_diff = float('inf')
 
         # Track audio tags suggested by QC for retry
         qc_suggested_tags = []
 
+        supports_audio_tags = self.model == 'eleven_v3'
+
         while attempt < max_retries:
             attempt += 1
 
             try:
                 # Modify script text with audio tags on retry attempts
                 adjusted_script_text = original_script_text
-                tags_to_add = []
 
                 # Only add audio tags for V3 model (V2 doesn't support them)
-                if attempt > 1 and self.model == 'eleven_v3':
-                    # Add timing tags based on speed adjustment
-                    if current_speed < 1.0:
-                        tags_to_add.append("slower")
-                    elif current_speed > 1.0:
-                        tags_to_add.append("faster")
-
-                    # Add QC-suggested tags from previous Audio QC failure
+                if attempt > 1 and supports_audio_tags:
+                    # Timing tag based on speed adjustment, then QC-suggested
+                    # tags from previous Audio QC failure (ordered, no duplicates)
+                    timing_tags = (
+                        ["slower"] if current_speed < 1.0
+                        else ["faster"] if current_speed > 1.0
+                        else []
+                    )
                     if qc_suggested_tags:
-                        for tag in qc_suggested_tags:
-                            if tag not in tags_to_add:
-                                tags_to_add.append(tag)
                         logger.info(f"Adding QC-suggested audio tags: {qc_suggested_tags}")
+                    tags_to_add = list(dict.fromkeys(timing_tags + qc_suggested_tags))
 
-                # Apply all tags to script (V3 only)
-                if tags_to_add and self.model == 'eleven_v3':
-                    tags_prefix = ' '.join(f'[{tag}]' for tag in tags_to_add)
-                    adjusted_script_text = f"{tags_prefix} {original_script_text}"
-                    logger.info(f"Script with audio tags: {tags_prefix} ...")
+                    if tags_to_add:
+                        tags_prefix = ' '.join([f'[{tag}]' for tag in tags_to_add])
+                        adjusted_script_text = f"{tags_prefix} {original_script_text}"
+                        logger.info(f"Script with audio tags: {tags_prefix} ...")
 
                 logger.info(
                     f"Attempt {attempt}/{max_retries} for {item.output_filename} "
@@ -301,8 +804,12 @@ class VoiceoverOrchestrator:
                 )
 
                 # Generate speech with speed parameter + timing guidance tags
+                # Throttle inside the retry loop so retries are shaped too
                 audio_data = self.retry_strategy.execute_with_retry(
-                    self.api_client.generate_speech,
+                    self._elevenlabs_bucket.throttle(
+                        self.api_client.generate_speech,
+                        tokens=len(adjusted_script_text)
+                    ),
                     text=adjusted_script_text,
                     voice_id=voice_id,
                     stability=item.stability,
@@ -314,56 +821,43 @@ class VoiceoverOrchestrator:
                 # Trim silence from beginning and end for accurate timing
                 # This happens BEFORE duration check to measure actual voice content
                 logger.info("Trimming silence from audio with padding")
-                audio_data = self.audio_processor.trim_silence(
+                # The trimmed duration comes from the same decode, so the
+                # audio isn't decoded a second time just to measure it
+                audio_data, actual_duration = self.audio_processor.trim_silence_with_duration(
                     audio_data,
                     silence_threshold=self.config.SILENCE_THRESHOLD,
                     padding_ms=self.config.SILENCE_PADDING_MS
                 )
 
-                # Measure duration of trimmed audio
-                actual_duration = self.audio_processor.get_duration(audio_data)
+                # Wrap once so the hash is computed at most once
+                audio = AudioBlob(audio_data, actual_duration)
 
                 logger.info(
                     f"Generated audio: {actual_duration:.2f}s "
-                    f"(target: {item.target_duration:.2f}s)"
+                    f"(target: {target_duration:.2f}s)"
                 )
 
                 # Track best attempt by duration accuracy
-                duration_diff = abs(actual_duration - item.target_duration)
+                duration_diff = abs(actual_duration - target_duration)
                 if duration_diff < best_duration_diff:
                     best_duration_diff = duration_diff
-                    best_attempt = {
-                        'audio_data': audio_data,
-                        'actual_duration': actual_duration,
-                        'attempt_number': attempt,
-                        'speed': current_speed
-                    }
+                    best_attempt = BestAttempt(
+                        audio=audio,
+                        actual_duration=actual_duration,
+                        attempt_number=attempt,
+                        speed=current_speed
+                    )
                     logger.info(f"New best attempt: {duration_diff:.2f}s off target")
 
                 # Check if timing is acceptable
-                if self.timing_adjuster.check_timing(actual_duration, item.target_duration):
+                if self.timing_adjuster.check_timing(actual_duration, target_duration):
                     # Timing is good, proceed with quality checks
                     logger.info("Timing acceptable, running quality checks")
 
-                    # Run quality checks
-                    quality_report = self.quality_checker.run_all_checks(
-                        audio_data,
-                        metadata={'target_duration': item.target_duration}
-                    )
-
-                    # Run Gemini audio quality control if enabled
-                    audio_qc_result = None
-                    if self.audio_qc_enabled:
-                        logger.info("Running Gemini audio quality control")
-                        audio_qc_result = self.gemini_audio_qc.analyze_audio(
-                            audio_data=audio_data,
-                            original_script=item.script_text,
-                            context={
-                                'target_duration': item.target_duration,
-                                'notes': item.notes
-                            }
-                        )
+                    # Run quality checks (and Gemini audio QC if enabled)
+                    quality_report, audio_qc_result = self._run_quality_checks(audio, item)
 
+                    if audio_qc_result:
                         # Log Audio QC results
                         logger.info(
                             f"Audio QC: {audio_qc_result.status.upper()} "
@@ -374,6 +868,11 @@ class VoiceoverOrchestrator:
                         if audio_qc_result.issues:
                             logger.info(f"Audio QC Issues: {', '.join(audio_qc_result.issues)}")
 
+                    # Remember the scores so the best-attempt fallback can reuse them
+                    if best_attempt and best_attempt.attempt_number == attempt:
+                        best_attempt.quality_report = quality_report
+                        best_attempt.audio_qc_result = audio_qc_result
+
                     # Check if Audio QC failed and we should retry with suggested tags
                     should_retry_for_audio_qc = False
                     if audio_qc_result and audio_qc_result.status == 'fail':
@@ -390,63 +889,37 @@ class VoiceoverOrchestrator:
                         # Continue loop to retry with QC-suggested tags
                         continue
 
-                    # Determine final status based on all checks
-                    if quality_report.passed:
-                        status = 'completed'
-
-                        # Check Audio QC if available
-                        if audio_qc_result:
-                            if audio_qc_result.status == 'fail':
-                                status = 'needs_review'
-                                issues.append(f"Audio QC failed: {audio_qc_result.reasoning}")
-                            elif audio_qc_result.status == 'flag':
-                                status = 'needs_review'
-                                issues.append(f"Audio QC flagged for review: {audio_qc_result.reasoning}")
-                    else:
-                        status = 'needs_review'
-                        if quality_report.issues:
-                            issues.extend(quality_report.issues)
-
-                    # Save audio with script text as metadata
-                    audio_path = self.output_manager.save_audio(
-                        audio_data,
-                        item.output_filename,
-                        status=status,
-                        script_text=item.script_text
-                    )
-
-                    # Create result
-                    return GenerationResult(
-                        filename=item.output_filename,
-                        status=status,
-                        attempts=attempt,
-                        final_duration=actual_duration,
-                        target_duration=item.target_duration,
-                        duration_diff=actual_duration - item.target_duration,
-                        quality_passed=quality_report.passed,
-                        issues=issues,
-                        notes=item.notes or "",
-                        audio_path=audio_path,
-                        audio_qc_status=audio_qc_result.status if audio_qc_result else None,
-                        audio_qc_score=audio_qc_result.score if audio_qc_result else None,
-                        audio_qc_issues=audio_qc_result.issues if audio_qc_result else [],
-                        audio_qc_strengths=audio_qc_result.strengths if audio_qc_result else [],
-                        audio_qc_guidance=audio_qc_result.guidance if audio_qc_result else None,
-                        audio_qc_suggested_tags=qc_suggested_tags
+                    return self._finalize_attempt(
+                        item, audio, actual_duration, attempt,
+                        quality_report, audio_qc_result, issues, qc_suggested_tags
                     )
 
                 else:
                     # Timing not acceptable, calculate adjustment
                     logger.warning(
                         f"Timing outside tolerance: "
-                        f"{actual_duration:.2f}s vs {item.target_duration:.2f}s"
+                        f"{actual_duration:.2f}s vs {target_duration:.2f}s"
                     )
 
+                    # Only an attempt that hit the timing gets scored, so a scored
+                    # best attempt means a QC-driven retry just lost the timing.
+                    # Keep the earlier take instead of spending more TTS calls.
+                    if best_attempt and best_attempt.quality_report is not None:
+                        logger.info(
+                            f"Best attempt (#{best_attempt.attempt_number}) is within "
+                            f"tolerance, finalizing it"
+                        )
+                        return self._finalize_attempt(
+                            item, best_attempt.audio, best_attempt.actual_duration,
+                            attempt, best_attempt.quality_report,
+                            best_attempt.audio_qc_result, issues, qc_suggested_tags
+                        )
+
                     if attempt < max_retries:
                         # Calculate new speed
                         adjustment = self.timing_adjuster.calculate_adjustment(
                             current_duration=actual_duration,
-                            target_duration=item.target_duration,
+                            target_duration=target_duration,
                             current_speed=current_speed
                         )
 
@@ -465,38 +938,26 @@ class VoiceoverOrchestrator:
                             logger.info(
                                 f"Retrying with clamped speed: {current_speed:.2f}"
                             )
-                            # Track the issue but continue trying
-                            if adjustment.reason not in issues:
-                                issues.append(adjustment.reason)
+                            # Track the issue but continue trying (deduplicated on return)
+                            issues.append(adjustment.reason)
                     else:
                         # Max retries reached - use best attempt
                         logger.warning(f"Max retries reached for {item.output_filename}")
 
                         if best_attempt:
                             logger.info(
-                                f"Saving best attempt (#{best_attempt['attempt_number']}): "
-                                f"{best_attempt['actual_duration']:.2f}s "
+                                f"Saving best attempt (#{best_attempt.attempt_number}): "
+                                f"{best_attempt.actual_duration:.2f}s "
                                 f"(off by {best_duration_diff:.2f}s)"
                             )
 
-                            # Run quality checks on best attempt
-                            quality_report = self.quality_checker.run_all_checks(
-                                best_attempt['audio_data'],
-                                metadata={'target_duration': item.target_duration}
+                            # Scored (in-tolerance) best attempts are finalized above,
+                            # so this one still needs its quality checks
+                            quality_report, audio_qc_result = self._run_quality_checks(
+                                best_attempt.audio, item
                             )
 
-                            # Run Gemini audio QC if enabled
-                            audio_qc_result = None
-                            if self.audio_qc_enabled:
-                                logger.info("Running Gemini audio quality control on best attempt")
-                                audio_qc_result = self.gemini_audio_qc.analyze_audio(
-                                    audio_data=best_attempt['audio_data'],
-                                    original_script=item.script_text,
-                                    context={
-                                        'target_duration': item.target_duration,
-                                        'notes': item.notes
-                                    }
-                                )
+                            if audio_qc_result:
                                 logger.info(
                                     f"Audio QC: {audio_qc_result.status.upper()} "
                                     f"(score: {audio_qc_result.score}/100)"
@@ -509,7 +970,7 @@ class VoiceoverOrchestrator:
 
                             # Save best attempt with needs_review status and script metadata
                             audio_path = self.output_manager.save_audio(
-                                best_attempt['audio_data'],
+                                best_attempt.audio.data,
                                 item.output_filename,
                                 status='needs_review',
                                 script_text=item.script_text
@@ -519,12 +980,12 @@ class VoiceoverOrchestrator:
                                 filename=item.output_filename,
                                 status='needs_review',
                                 attempts=attempt,
-                                final_duration=best_attempt['actual_duration'],
-                                target_duration=item.target_duration,
-                                duration_diff=best_attempt['actual_duration'] - item.target_duration,
+                                final_duration=best_attempt.actual_duration,
+                                target_duration=target_duration,
+                                duration_diff=best_attempt.actual_duration - target_duration,
                                 quality_passed=quality_report.passed,
                                 issues=attempt_issues,
-                                notes=item.notes or "",
+                                notes=notes,
                                 audio_path=audio_path,
                                 audio_qc_status=audio_qc_result.status if audio_qc_result else None,
                                 audio_qc_score=audio_qc_result.score if audio_qc_result else None,
@@ -539,7 +1000,7 @@ class VoiceoverOrchestrator:
                                 filename=item.output_filename,
                                 status='failed',
                                 attempts=attempt,
-                                target_duration=item.target_duration,
+                                target_duration=target_duration,
                                 error="No successful audio generation in any attempt"
                             )
 
@@ -552,7 +1013,7 @@ class VoiceoverOrchestrator:
                         filename=item.output_filename,
                         status='failed',
                         attempts=attempt,
-                        target_duration=item.target_duration,
+                        target_duration=target_duration,
                         error=str(e)
                     )
 
@@ -561,7 +1022,7 @@ class VoiceoverOrchestrator:
             filename=item.output_filename,
             status='failed',
             attempts=attempt,
-            target_duration=item.target_duration,
+            target_duration=target_duration,
             error="Unknown error occurred"
         )
 
@@ -0,0 +1,102 @@
+"""
+Token bucket rate limiter for shaping outbound API calls.
+"""
+from typing import Callable, TypeVar
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds up to ``capacity`` tokens and refills at ``refill_rate`` tokens
+    per second. Callers block in ``acquire`` until enough tokens are
+    available, so requests are spread to fit a provider's budget instead
+    of being rejected with 429s and retried.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize token bucket (starts full).
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            refill_rate: Tokens added per second
+
+        Raises:
+            ValueError: If capacity or refill_rate is not positive
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("capacity and refill_rate must be positive")
+
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add tokens accrued since the last refill. Caller holds the lock."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+        self._last_refill = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until ``tokens`` are available, then consume them.
+
+        Requests larger than the bucket are clamped to its capacity so
+        they wait for a full bucket rather than forever.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            Total seconds spent waiting
+        """
+        tokens = min(max(float(tokens), 0.0), self.capacity)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+                wait = (tokens - self._tokens) / self.refill_rate
+
+            # Sleep outside the lock so other threads can refill/consume
+            time.sleep(wait)
+            waited += wait
+
+        if waited:
+            logger.debug(f"Rate limiter waited {waited:.2f}s for {tokens:.0f} tokens")
+
+        return waited
+
+    def throttle(self, func: Callable[..., T], tokens: float = 1.0) -> Callable[..., T]:
+        """
+        Wrap a function so every call acquires ``tokens`` first.
+
+        Useful with RetryStrategy.execute_with_retry so that retries are
+        throttled as well as the first attempt.
+
+        Args:
+            func: Function to wrap
+            tokens: Tokens consumed per call
+
+        Returns:
+            Wrapped function
+        """
+        def wrapper(*args, **kwargs) -> T:
+            self.acquire(tokens)
+            return func(*args, **kwargs)
+
+        return wrapper
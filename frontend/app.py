@@ -2,10 +2,13 @@
 Flask web application for bulk voiceover generation.
 """
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
 from datetime import datetime
 import threading
+import time
 import uuid
 import zipfile
 
@@ -19,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from backend.config.settings import Config
 from backend.src.workflow.orchestrator import VoiceoverOrchestrator
 from backend.src.utils.logger import setup_logging
+from backend.src.utils.ttl_cache import TTLCache
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -42,10 +46,83 @@ app.config['MAX_CONTENT_LENGTH'] = Config.MAX_CONTENT_LENGTH
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
 
-# Global storage for batch status (in production, use Redis or database)
-batch_status = {}
-batch_results = {}
-batch_models = {}  # Store model selection per batch
+# Signature of the files in each built download zip, keyed by (batch_id, folder)
+# zip_cache_lock only guards these dicts; each zip is built under its own
+# lock so a large build doesn't hold up downloads of other batches
+zip_cache = {}
+zip_build_locks = {}
+zip_cache_lock = threading.Lock()
+
+
+def discard_batch_downloads(batch_id, result=None):
+    """Delete the download zips built for a batch that is no longer tracked."""
+    with zip_cache_lock:
+        for key in [key for key in zip_cache if key[0] == batch_id]:
+            del zip_cache[key]
+        for key in [key for key in zip_build_locks if key[0] == batch_id]:
+            del zip_build_locks[key]
+    for zip_path in UPLOAD_FOLDER.glob(f'{batch_id}_*.zip'):
+        zip_path.unlink(missing_ok=True)
+
+
+def sweep_upload_folder():
+    """Delete uploads and zips older than the batch TTL."""
+    cutoff = time.time() - Config.BATCH_TTL_SECONDS
+    with os.scandir(UPLOAD_FOLDER) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                # Removed by a concurrent sweep
+                continue
+
+
+# Global storage for batch status (in production, use Redis or database).
+# Bounded and expiring so a long-running server doesn't grow without limit.
+batch_status = TTLCache(Config.MAX_TRACKED_BATCHES, Config.BATCH_TTL_SECONDS)
+batch_results = TTLCache(
+    Config.MAX_TRACKED_BATCHES, Config.BATCH_TTL_SECONDS, on_evict=discard_batch_downloads
+)
+batch_models = TTLCache(Config.MAX_TRACKED_BATCHES, Config.BATCH_TTL_SECONDS)  # Store model selection per batch
+
+# Publish progress to batch_status every N items, or sooner if this many
+# seconds have passed, so slow batches still show movement
+PROGRESS_UPDATE_EVERY = 1000
+PROGRESS_UPDATE_INTERVAL = 1.0
+
+# Orchestrators are costly to build (API clients, audio stack), so requests
+# share one per model. Models come from the client, hence the small LRU bound.
+MAX_CACHED_ORCHESTRATORS = 4
+orchestrators = OrderedDict()
+orchestrators_lock = threading.Lock()
+
+
+# Batches run on a bounded pool (each batch also runs its own item pool).
+# Threads rather than processes: the work is API-bound and batch state lives
+# in this process's dicts.
+batch_executor = ThreadPoolExecutor(
+    max_workers=Config.BATCH_WORKERS, thread_name_prefix='batch'
+)
+# concurrent.futures joins its workers from a threading exit hook, which runs
+# before atexit handlers. Hooks run last-registered first, so this one drops
+# queued batches before that join; batches already running still finish.
+threading._register_atexit(batch_executor.shutdown, wait=False, cancel_futures=True)
+batch_futures = TTLCache(Config.MAX_TRACKED_BATCHES, Config.BATCH_TTL_SECONDS)
+
+
+def get_orchestrator(model=None):
+    """Get the shared orchestrator for a model, creating it on first use."""
+    with orchestrators_lock:
+        orchestrator = orchestrators.get(model)
+        if orchestrator is None:
+            orchestrator = VoiceoverOrchestrator(model=model)
+            orchestrators[model] = orchestrator
+            if len(orchestrators) > MAX_CACHED_ORCHESTRATORS:
+                orchestrators.popitem(last=False)
+        else:
+            orchestrators.move_to_end(model)
+        return orchestrator
 
 
 def allowed_file(filename):
@@ -54,7 +131,7 @@ def allowed_file(filename):
 
 
 def process_batch_async(batch_id, input_file, orchestrator):
-    """Process batch in background thread."""
+    """Process batch on a batch_executor worker."""
     try:
         batch_status[batch_id] = {
             'status': 'processing',
@@ -63,12 +140,27 @@ def process_batch_async(batch_id, input_file, orchestrator):
             'message': 'Starting...'
         }
 
-        def progress_callback(current, total, item):
-            batch_status[batch_id].update({
-                'current': current,
-                'total': total,
-                'message': f'Processing {item.filename}...'
-            })
+        last_update = {'current': 0, 'time': time.monotonic()}
+
+        def progress_callback(event):
+            now = time.monotonic()
+            if (
+                event.current - last_update['current'] < PROGRESS_UPDATE_EVERY
+                and now - last_update['time'] < PROGRESS_UPDATE_INTERVAL
+                and event.current != event.total
+            ):
+                return
+
+            # Set rather than update in place: a running batch may have been
+            # evicted from batch_status, and setting also renews its TTL
+            batch_status[batch_id] = {
+                'status': 'processing',
+                'current': event.current,
+                'total': event.total,
+                'message': f'Processing {event.item.filename}...'
+            }
+            last_update['current'] = event.current
+            last_update['time'] = now
 
         result = orchestrator.process_batch(
             input_file=input_file,
@@ -122,9 +214,10 @@ def upload_file():
         filepath = Path(app.config['UPLOAD_FOLDER']) / save_filename
 
         file.save(str(filepath))
+        sweep_upload_folder()
 
         # Validate file
-        orchestrator = VoiceoverOrchestrator()
+        orchestrator = get_orchestrator()
         validation_result = orchestrator.validate_input(str(filepath))
 
         if not validation_result['is_valid']:
@@ -166,15 +259,18 @@ def generate_batch(batch_id):
         model = data.get('model') or batch_models.get(batch_id, 'eleven_multilingual_v2')
 
         # Initialize orchestrator with selected model
-        orchestrator = VoiceoverOrchestrator(model=model)
+        orchestrator = get_orchestrator(model)
 
-        # Start background processing
-        thread = threading.Thread(
-            target=process_batch_async,
-            args=(batch_id, filepath, orchestrator)
+        # Queue background processing; it starts when a worker is free
+        batch_status[batch_id] = {
+            'status': 'queued',
+            'current': 0,
+            'total': 0,
+            'message': 'Waiting for a free worker...'
+        }
+        batch_futures[batch_id] = batch_executor.submit(
+            process_batch_async, batch_id, filepath, orchestrator
         )
-        thread.daemon = True
-        thread.start()
 
         return jsonify({
             'success': True,
@@ -190,19 +286,31 @@ def generate_batch(batch_id):
 @app.route('/status/<batch_id>')
 def get_status(batch_id):
     """Get batch processing status."""
-    if batch_id not in batch_status:
+    # One lookup: an entry can expire between an `in` check and indexing
+    status = batch_status.get(batch_id)
+    if status is None:
         return jsonify({'error': 'Batch not found'}), 404
 
-    return jsonify(batch_status[batch_id])
+    # process_batch_async reports its own errors; this catches anything that
+    # escaped it so the page doesn't poll a dead batch forever
+    future = batch_futures.get(batch_id)
+    if future is not None and future.done():
+        if future.cancelled():
+            return jsonify({'status': 'error', 'message': 'Batch was cancelled'})
+        if future.exception() is not None:
+            return jsonify({'status': 'error', 'message': str(future.exception())})
+
+    return jsonify(status)
 
 
 @app.route('/results/<batch_id>')
 def get_results(batch_id):
     """Get batch results."""
-    if batch_id not in batch_results:
+    result = batch_results.get(batch_id)
+    if result is None:
         # Check if still processing
-        if batch_id in batch_status:
-            status = batch_status[batch_id]
+        status = batch_status.get(batch_id)
+        if status is not None:
             return jsonify({
                 'processing': True,
                 'status': status
@@ -210,8 +318,6 @@ def get_results(batch_id):
         else:
             return jsonify({'error': 'Batch not found'}), 404
 
-    result = batch_results[batch_id]
-
     return jsonify({
         'batch_id': result.batch_id,
         'timestamp': result.timestamp.isoformat(),
@@ -220,7 +326,7 @@ def get_results(batch_id):
         'failed': result.failed_items,
         'needs_review': result.review_items,
         'total_duration': result.total_duration,
-        'results': [r.to_dict() for r in result.results]
+        'results': [r.to_json_dict() for r in result.results]
     })
 
 
@@ -236,47 +342,86 @@ def results_page(batch_id):
 @app.route('/download/<batch_id>/<folder>')
 def download_folder(batch_id, folder):
     """Download files from a specific batch as zip."""
-    if batch_id not in batch_results:
+    batch = batch_results.get(batch_id)
+    if batch is None:
         return "Batch not found", 404
 
     if folder not in ['completed', 'failed', 'needs_review', 'all']:
         return "Invalid folder", 400
 
     try:
-        # Get the batch results for this specific batch
-        batch = batch_results[batch_id]
+        # Only include files from this batch
+        entries = []
+        for result in batch.results:
+            # Skip if no audio path (failed before generation)
+            if not result.audio_path:
+                continue
+
+            # Filter by folder type
+            if folder == 'all':
+                # Include all files
+                entries.append((Path(result.audio_path), f'{result.status}/{result.filename}'))
+            elif result.status == folder:
+                # Include only files matching the requested status
+                entries.append((Path(result.audio_path), result.filename))
+
+        if folder == 'all':
+            # Written once by process_batch; never regenerated here
+            report_path = batch.report_paths.get('csv')
+            if report_path is not None:
+                entries.append((Path(report_path), 'report.csv'))
+
+        # Files move between status folders (e.g. deferred QC), so the
+        # signature covers where each file is as well as its size and mtime
+        signature = []
+        for path, arcname in entries:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature.append((str(path), arcname, stat.st_size, stat.st_mtime_ns))
+        signature = tuple(signature)
 
-        # Create temporary zip file
         zip_path = Path(app.config['UPLOAD_FOLDER']) / f'{batch_id}_{folder}.zip'
 
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            # Only include files from this batch
-            for result in batch.results:
-                # Skip if no audio path (failed before generation)
-                if not result.audio_path or not Path(result.audio_path).exists():
-                    continue
-
-                # Filter by folder type
-                if folder == 'all':
-                    # Include all files
-                    zipf.write(result.audio_path, f'{result.status}/{result.filename}')
-                elif result.status == folder:
-                    # Include only files matching the requested status
-                    zipf.write(result.audio_path, result.filename)
-
-            # Add report
-            if folder == 'all':
-                result = batch_results[batch_id]
-                timestamp = result.timestamp.strftime('%Y%m%d_%H%M%S')
-                report_path = Config.LOGS_DIR / f"report_{batch_id}_{timestamp}.csv"
-                if report_path.exists():
-                    zipf.write(report_path, 'report.csv')
-
+        key = (batch_id, folder)
+        with zip_cache_lock:
+            build_lock = zip_build_locks.setdefault(key, threading.Lock())
+
+        # Concurrent requests for the same zip wait for one build
+        with build_lock:
+            with zip_cache_lock:
+                cached = zip_cache.get(key)
+
+            if cached != signature or not zip_path.exists():
+                # Build next to the target and swap in, so a concurrent
+                # download never serves a half-written archive
+                tmp_path = zip_path.with_name(f'.{zip_path.name}.{uuid.uuid4().hex}')
+                try:
+                    # MP3s are already compressed, so store them as-is
+                    with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zipf:
+                        for source, arcname, _, _ in signature:
+                            zipf.write(source, arcname)
+                    os.replace(tmp_path, zip_path)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+
+                with zip_cache_lock:
+                    zip_cache[key] = signature
+
+        # Repeat downloads reuse the archive; conditional requests get a 304.
+        # Passing the path lets Werkzeug set Content-Length and serve the
+        # file through wsgi.file_wrapper (sendfile on servers that support it).
+        # The zip holds MP3s, so it is never compressed in transit.
         return send_file(
             str(zip_path),
             as_attachment=True,
             download_name=f'{batch_id}_{folder}.zip',
-            mimetype='application/zip'
+            mimetype='application/zip',
+            conditional=True,
+            etag=True,
+            last_modified=zip_path.stat().st_mtime
         )
 
     except Exception as e:
@@ -286,22 +431,26 @@ def download_folder(batch_id, folder):
 @app.route('/download/<batch_id>/report')
 def download_report(batch_id):
     """Download CSV report."""
-    if batch_id not in batch_results:
+    result = batch_results.get(batch_id)
+    if result is None:
         return "Batch not found", 404
 
     try:
-        result = batch_results[batch_id]
-        timestamp = result.timestamp.strftime('%Y%m%d_%H%M%S')
-        report_path = Config.LOGS_DIR / f"report_{batch_id}_{timestamp}.csv"
+        report_path = result.report_paths.get('csv')
 
-        if not report_path.exists():
+        if report_path is None or not report_path.exists():
             return "Report not found", 404
 
+        # Sent by path (not as an open file) so Werkzeug can set
+        # Content-Length and an ETag and hand the fd to wsgi.file_wrapper.
+        # Compression, if any, is left to the reverse proxy.
         return send_file(
             str(report_path),
             as_attachment=True,
             download_name=f'report_{batch_id}.csv',
-            mimetype='text/csv'
+            mimetype='text/csv',
+            conditional=True,
+            etag=True
         )
 
     except Exception as e:
@@ -338,7 +487,7 @@ def download_template(model):
 def get_voices():
     """Get available voices."""
     try:
-        orchestrator = VoiceoverOrchestrator()
+        orchestrator = get_orchestrator()
         voices = orchestrator.get_available_voices()
 
         return jsonify({
@@ -0,0 +1,31 @@
+"""
+Shared test fixtures.
+"""
+import pytest
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module: monotonic() is advanced by sleep()."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    """A FakeClock starting at t=1000s."""
+    return FakeClock()
@@ -0,0 +1,140 @@
+"""
+Parity tests: the column-wise ParsedBatch validator must agree with the
+per-row _parse_row rules it replaced.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.src.workflow.input_parser import (
+    InputParser,
+    TEXT_COLUMN_DTYPES,
+    _MISSING_VOICE_MESSAGE,
+)
+
+HEADER = "script_text,target_duration,output_filename,voice_id,voice_name,stability,similarity_boost,style,speed,notes\n"
+
+
+@pytest.fixture
+def parser():
+    return InputParser()
+
+
+def parse_both(parser, tmp_path, rows):
+    """Parse CSV rows with parse_batch and with _parse_row; return both."""
+    path = tmp_path / "input.csv"
+    path.write_text(HEADER + "".join(row + "\n" for row in rows), encoding="utf-8")
+
+    batch, critical_errors = parser.parse_batch(str(path))
+    assert critical_errors == []
+
+    df = pd.read_csv(path, usecols=parser._is_known_column, dtype=TEXT_COLUMN_DTYPES)
+    expected = [
+        parser._parse_row(row, batch.first_row_number + i)
+        for i, (_, row) in enumerate(df.iterrows())
+    ]
+    return batch, expected
+
+
+def assert_parity(batch, expected):
+    assert batch.items() == expected
+    assert [batch.item(i) for i in range(len(batch))] == expected
+    assert batch.valid_mask.tolist() == [item.is_valid for item in expected]
+    assert [item.row_number for item in batch.iter_valid()] == [
+        item.row_number for item in expected if item.is_valid
+    ]
+
+
+def test_valid_rows(parser, tmp_path):
+    batch, expected = parse_both(parser, tmp_path, [
+        "Hello there,5,a.mp3,vid1,,0.4,0.8,0.1,1.1,note",
+        "Second line,2.5,b.mp3,,Rachel,,,,,",
+    ])
+
+    assert_parity(batch, expected)
+    assert all(item.is_valid for item in expected)
+
+
+def test_empty_text(parser, tmp_path):
+    batch, expected = parse_both(parser, tmp_path, [
+        ",5,a.mp3,vid1,,,,,,",
+        "   ,5,b.mp3,vid1,,,,,,",
+    ])
+
+    assert_parity(batch, expected)
+    assert not any(item.is_valid for item in expected)
+
+
+@pytest.mark.parametrize("duration", ["", "abc", "0", "-3"])
+def test_bad_duration(parser, tmp_path, duration):
+    batch, expected = parse_both(parser, tmp_path, [f"Hello,{duration},a.mp3,vid1,,,,,,"])
+
+    assert_parity(batch, expected)
+    assert not expected[0].is_valid
+
+
+def test_out_of_range_and_invalid_settings(parser, tmp_path):
+    batch, expected = parse_both(parser, tmp_path, [
+        "Hello,5,a.mp3,vid1,,1.5,-0.1,2,3,",
+        "Hello,5,b.mp3,vid1,,x,0.5,0.5,0.1,",
+    ])
+
+    assert_parity(batch, expected)
+
+
+def test_unknown_voice(parser, tmp_path):
+    batch, expected = parse_both(parser, tmp_path, [
+        "Hello,5,a.mp3,,,,,,,",
+        "Hello,5,b.mp3,  ,  ,,,,,",
+    ])
+
+    assert_parity(batch, expected)
+    assert all(item.errors == [_MISSING_VOICE_MESSAGE] for item in expected)
+
+
+def test_duplicate_filenames(parser, tmp_path):
+    # Later valid rows reusing an output filename are rejected; rows that are
+    # already invalid are never generated, so they don't claim a filename
+    batch, expected = parse_both(parser, tmp_path, [
+        "Hello,5,same.mp3,vid1,,,,,,",
+        "Again,5,same.mp3,vid1,,,,,,",
+        "Broken,-1,other.mp3,vid1,,,,,,",
+        "Fine,5,other.mp3,vid1,,,,,,",
+        "Third,5,same.mp3,vid1,,,,,,",
+    ])
+
+    for i in (1, 4):
+        expected[i].errors.append("Duplicate output_filename: same.mp3")
+    assert_parity(batch, expected)
+    assert batch.valid_mask.tolist() == [True, False, False, True, False]
+
+
+def test_error_bitmask_decodes_to_messages(parser, tmp_path):
+    batch, expected = parse_both(parser, tmp_path, [
+        "Hello,5,a.mp3,vid1,,,,,,",
+        ",-1,,,,1.5,,,9,",
+        "Hello,abc,a.mp3,,,,,,,",
+    ])
+
+    assert_parity(batch, expected)
+    assert batch.error_codes[0] == 0
+    for i, item in enumerate(expected):
+        code = int(batch.error_codes[i])
+        # One bit per reported error, in the order _parse_row reports them
+        assert bin(code).count("1") == len(item.errors)
+        assert batch.errors[i] == item.errors
+    assert list(batch.iter_errors()) == [
+        (item.row_number, error) for item in expected for error in item.errors
+    ]
+
+
+def test_summary_matches_items(parser, tmp_path):
+    batch, expected = parse_both(parser, tmp_path, [
+        "Hello,5,a.mp3,vid1,,,,,,",
+        "Hello,2,b.mp3,vid1,,,,,,",
+        ",3,c.mp3,vid1,,,,,,",
+    ])
+
+    assert batch.get_summary() == parser.get_summary(expected)
+    assert batch.get_summary()["total_duration"] == 7.0
+    assert np.isclose(batch.get_summary()["avg_duration"], 3.5)
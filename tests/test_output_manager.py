@@ -0,0 +1,183 @@
+"""
+Tests for the streamed CSV/JSON batch reports.
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backend.src.workflow.output_manager import (
+    BatchResult,
+    GenerationResult,
+    OutputManager,
+    REPORT_FIELDS,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return OutputManager(output_dir=tmp_path / "output", logs_dir=tmp_path / "logs")
+
+
+@pytest.fixture
+def batch_result():
+    batch = BatchResult(
+        batch_id="abc123",
+        input_file="input.csv",
+        timestamp=datetime(2024, 1, 2, 3, 4, 5),
+        total_items=3
+    )
+    batch.add_result(GenerationResult(
+        filename="a.mp3",
+        status="completed",
+        attempts=1,
+        final_duration=5.1,
+        target_duration=5.0,
+        duration_diff=0.1,
+        quality_passed=True,
+        issues=["minor clipping", 'quoted "text", with comma'],
+        notes="café",
+        audio_path=Path("/tmp/a.mp3"),
+        audio_qc_status="pass",
+        audio_qc_score=92.5,
+        audio_qc_issues=["slight hiss"],
+        audio_qc_strengths=["clear", "natural"],
+        audio_qc_guidance="none",
+        audio_qc_suggested_tags=["[calm]"]
+    ))
+    batch.add_result(GenerationResult(
+        filename="b.mp3",
+        status="failed",
+        attempts=5,
+        error="API error\nsecond line"
+    ))
+    batch.add_result(GenerationResult(
+        filename="c.mp3",
+        status="needs_review",
+        attempts=3,
+        final_duration=7.9,
+        target_duration=7.0,
+        duration_diff=0.9
+    ))
+    return batch
+
+
+def baseline_row(result):
+    """
+    GenerationResult.to_dict() as it was before the streamed reports, except
+    that the Gemini list fields are joined with '; ' instead of reaching the
+    CSV as Python reprs (a deliberate fix made alongside the streaming).
+    """
+    return {
+        'filename': result.filename,
+        'status': result.status,
+        'attempts': result.attempts,
+        'final_duration': result.final_duration,
+        'target_duration': result.target_duration,
+        'duration_diff': result.duration_diff,
+        'quality_passed': result.quality_passed,
+        'issues': '; '.join(result.issues) if result.issues else '',
+        'notes': result.notes,
+        'error': result.error,
+        'audio_qc_status': result.audio_qc_status,
+        'audio_qc_score': result.audio_qc_score,
+        'audio_qc_issues': '; '.join(result.audio_qc_issues),
+        'audio_qc_strengths': '; '.join(result.audio_qc_strengths),
+        'audio_qc_guidance': result.audio_qc_guidance,
+        'audio_qc_suggested_tags': '; '.join(result.audio_qc_suggested_tags)
+    }
+
+
+def reference_csv(batch_result):
+    """
+    The report as the pre-streaming implementation wrote it: baseline
+    to_dict() rows through pd.DataFrame(...).to_csv, independent of
+    to_csv_row() and REPORT_FIELDS.
+    """
+    rows = [baseline_row(result) for result in batch_result.results]
+    return pd.DataFrame(rows).to_csv(index=False)
+
+
+def reference_json(batch_result):
+    """The report document as the pre-streaming json.dump implementation built it."""
+    return {
+        'batch_id': batch_result.batch_id,
+        'input_file': batch_result.input_file,
+        'timestamp': batch_result.timestamp.isoformat(),
+        'summary': {
+            'total_items': batch_result.total_items,
+            'completed': batch_result.completed_items,
+            'failed': batch_result.failed_items,
+            'needs_review': batch_result.review_items,
+            'total_duration': batch_result.total_duration
+        },
+        'results': [result.to_json_dict() for result in batch_result.results]
+    }
+
+
+def test_streamed_csv_matches_non_streamed(manager, batch_result):
+    path = manager.generate_report(batch_result, format='csv')
+
+    assert path.read_text(encoding='utf-8') == reference_csv(batch_result)
+
+
+def test_csv_report_bytes(manager, batch_result):
+    # Pinned literally, so a change shared by the writer and the reference
+    # can't go unnoticed
+    path = manager.generate_report(batch_result, format='csv')
+
+    assert path.read_text(encoding='utf-8') == (
+        "filename,status,attempts,final_duration,target_duration,duration_diff,"
+        "quality_passed,issues,notes,error,audio_qc_status,audio_qc_score,"
+        "audio_qc_issues,audio_qc_strengths,audio_qc_guidance,audio_qc_suggested_tags\n"
+        'a.mp3,completed,1,5.1,5.0,0.1,True,"minor clipping; quoted ""text"", with comma",'
+        "café,,pass,92.5,slight hiss,clear; natural,none,[calm]\n"
+        'b.mp3,failed,5,,,,False,,,"API error\nsecond line",,,,,,\n'
+        "c.mp3,needs_review,3,7.9,7.0,0.9,False,,,,,,,,,\n"
+    )
+
+
+def test_streamed_json_matches_non_streamed(manager, batch_result):
+    path = manager.generate_report(batch_result, format='json')
+
+    assert json.loads(path.read_text(encoding='utf-8')) == reference_json(batch_result)
+
+
+def test_single_pass_matches_separate_reports(manager, batch_result):
+    paths = manager.generate_reports(batch_result, formats=('csv', 'json'))
+
+    assert paths['csv'].read_text(encoding='utf-8') == reference_csv(batch_result)
+    assert json.loads(paths['json'].read_text(encoding='utf-8')) == reference_json(batch_result)
+    assert batch_result.report_paths == paths
+
+
+def test_empty_batch_reports(manager):
+    batch = BatchResult(batch_id="empty", input_file="x.csv", timestamp=datetime(2024, 1, 1))
+
+    paths = manager.generate_reports(batch, formats=('csv', 'json'))
+
+    assert paths['csv'].read_text(encoding='utf-8') == ",".join(REPORT_FIELDS) + "\n"
+    assert json.loads(paths['json'].read_text(encoding='utf-8')) == reference_json(batch)
+
+
+def test_failure_mid_stream_leaves_no_report(manager, batch_result, monkeypatch):
+    calls = 0
+    original = GenerationResult.to_json_dict
+
+    def failing_to_json_dict(self):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("boom")
+        return original(self)
+
+    monkeypatch.setattr(GenerationResult, "to_json_dict", failing_to_json_dict)
+
+    with pytest.raises(RuntimeError):
+        manager.generate_reports(batch_result, formats=('csv', 'json'))
+
+    # Neither the partial reports nor their temporary files are left behind
+    assert list(manager.logs_dir.iterdir()) == []
+    assert batch_result.report_paths == {}
@@ -0,0 +1,88 @@
+"""
+Tests for the TokenBucket rate limiter.
+"""
+import pytest
+
+from backend.src.workflow import rate_limiter
+from backend.src.workflow.rate_limiter import TokenBucket
+
+
+@pytest.fixture
+def clock(fake_clock, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "time", fake_clock)
+    return fake_clock
+
+
+def test_rejects_non_positive_settings():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, refill_rate=1)
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=1, refill_rate=0)
+
+
+def test_starts_full_and_does_not_wait_within_capacity(clock):
+    bucket = TokenBucket(capacity=10, refill_rate=1)
+
+    assert bucket.acquire(4) == 0
+    assert bucket.acquire(6) == 0
+    assert clock.sleeps == []
+
+
+def test_waits_for_refill_when_empty(clock):
+    bucket = TokenBucket(capacity=10, refill_rate=2)
+    bucket.acquire(10)
+
+    waited = bucket.acquire(3)
+
+    assert waited == pytest.approx(1.5)
+    assert clock.sleeps == [pytest.approx(1.5)]
+
+
+def test_refill_accrues_with_elapsed_time(clock):
+    bucket = TokenBucket(capacity=10, refill_rate=2)
+    bucket.acquire(10)
+    clock.advance(2)  # 4 tokens back
+
+    assert bucket.acquire(4) == 0
+    assert bucket.acquire(1) == pytest.approx(0.5)
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(capacity=10, refill_rate=5)
+    bucket.acquire(10)
+    clock.advance(60)  # far more than a full refill
+
+    assert bucket.acquire(10) == 0
+    # Nothing banked beyond capacity
+    assert bucket.acquire(5) == pytest.approx(1.0)
+
+
+def test_request_larger_than_capacity_waits_for_full_bucket(clock):
+    bucket = TokenBucket(capacity=10, refill_rate=2)
+    bucket.acquire(4)  # 6 left
+
+    waited = bucket.acquire(50)
+
+    # Clamped to 10 tokens: needs 4 more at 2/s
+    assert waited == pytest.approx(2.0)
+    assert bucket.acquire(1) == pytest.approx(0.5)
+
+
+def test_zero_and_negative_requests_do_not_consume(clock):
+    bucket = TokenBucket(capacity=1, refill_rate=1)
+
+    assert bucket.acquire(0) == 0
+    assert bucket.acquire(-5) == 0
+    assert bucket.acquire(1) == 0
+
+
+def test_throttle_acquires_before_each_call(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=1)
+    calls = []
+    throttled = bucket.throttle(lambda x: calls.append(x) or x * 2, tokens=2)
+
+    assert throttled(1) == 2
+    assert throttled(2) == 4
+
+    assert calls == [1, 2]
+    assert clock.sleeps == [pytest.approx(2.0)]
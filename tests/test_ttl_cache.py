@@ -0,0 +1,125 @@
+"""
+Tests for the bounded, expiring TTLCache.
+"""
+import pytest
+
+from backend.src.utils import ttl_cache
+from backend.src.utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(fake_clock, monkeypatch):
+    monkeypatch.setattr(ttl_cache, "time", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def evicted():
+    return []
+
+
+@pytest.fixture
+def cache(clock, evicted):
+    return TTLCache(maxsize=3, ttl=10, on_evict=lambda key, value: evicted.append(key))
+
+
+def test_rejects_non_positive_limits():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0, ttl=1)
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=1, ttl=0)
+
+
+def test_entry_lives_until_ttl(cache, clock):
+    cache["a"] = 1
+    clock.advance(9.9)
+
+    assert "a" in cache
+    assert cache["a"] == 1
+
+
+def test_entry_expires_after_ttl(cache, clock, evicted):
+    cache["a"] = 1
+    clock.advance(10)
+
+    with pytest.raises(KeyError):
+        cache["a"]
+    assert cache.get("a") is None
+    assert evicted == ["a"]
+
+
+def test_contains_drops_expired_entry(cache, clock, evicted):
+    cache["a"] = 1
+    clock.advance(10)
+
+    assert "a" not in cache
+    assert evicted == ["a"]
+    # The entry is gone, not just hidden
+    assert len(cache) == 0
+    assert evicted == ["a"]
+
+
+def test_setting_renews_ttl(cache, clock):
+    cache["a"] = 1
+    clock.advance(8)
+    cache["a"] = 2
+    clock.advance(8)
+
+    assert cache["a"] == 2
+
+
+def test_reading_does_not_renew_ttl(cache, clock):
+    cache["a"] = 1
+    clock.advance(8)
+    assert cache["a"] == 1
+    clock.advance(2)
+
+    assert "a" not in cache
+
+
+def test_in_place_mutation_is_visible(cache):
+    cache["a"] = {"current": 0}
+    cache["a"]["current"] = 5
+
+    assert cache["a"] == {"current": 5}
+
+
+def test_evicts_least_recently_used_at_maxsize(cache, evicted):
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    cache["a"]  # "b" is now least recently used
+    cache["d"] = 4
+
+    assert evicted == ["b"]
+    assert sorted(cache) == ["a", "c", "d"]
+
+
+def test_expired_entries_are_dropped_before_size_eviction(cache, clock, evicted):
+    cache["a"] = 1
+    clock.advance(5)
+    cache["b"] = 2
+    cache["c"] = 3
+    clock.advance(5)  # only "a" has expired
+    cache["d"] = 4
+
+    assert evicted == ["a"]
+    assert sorted(cache) == ["b", "c", "d"]
+
+
+def test_delete_does_not_call_on_evict(cache, evicted):
+    cache["a"] = 1
+    del cache["a"]
+
+    assert "a" not in cache
+    assert evicted == []
+
+
+def test_len_and_iter_skip_expired(cache, clock):
+    cache["a"] = 1
+    clock.advance(5)
+    cache["b"] = 2
+    clock.advance(5)
+
+    assert len(cache) == 1
+    assert list(cache) == ["b"]